@@ -1,19 +1,78 @@
 """Chord detection using pychord library"""
 
+import os
+import pickle
 from typing import Dict, List, Tuple, Optional, Any
 from pychord import find_chords_from_notes
 
+# Chromatic note names, shared by the mask-based detection below
+NOTE_NAMES: Tuple[str, ...] = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+
+# Suffix appended to partial chord matches (constant, so no per-call f-string)
+_PARTIAL: str = " (partial)"
+
+# Power chord (root + perfect fifth) info for every ordered pitch-class pair,
+# or None when the pair isn't a fifth - indexed as _POWER_CHORD[low][high]
+_POWER_CHORD: List[List[Optional[Dict[str, str]]]] = [
+    [
+        {'name': f"{NOTE_NAMES[a]}5", 'root': NOTE_NAMES[a]} if (b - a) % 12 == 7
+        else {'name': f"{NOTE_NAMES[b]}5", 'root': NOTE_NAMES[b]} if (a - b) % 12 == 7
+        else None
+        for b in range(12)
+    ]
+    for a in range(12)
+]
+
+# On-disk cache for the precomputed chord table (bump version when detection changes)
+_CHORD_TABLE_VERSION: int = 2
+_CHORD_TABLE_PATH: str = os.path.join(os.path.expanduser("~"), ".cache", "midiguitar_chords.pkl")
+
 
 class ChordDetector:
     """Detects musical chords from sets of MIDI notes
-    
+
     Uses the pychord library for comprehensive chord recognition,
     including complex chords, inversions, and partial chord matching.
     """
-    
+
     def __init__(self) -> None:
-        """Initialize chord detector with chromatic note names"""
-        self.note_names: List[str] = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+        """Initialize chord detector with chromatic note names and the chord table"""
+        self.note_names: List[str] = list(NOTE_NAMES)
+        # Precomputed name tables for the full MIDI range, so the per-note
+        # conversions are a single indexed load instead of modulo + f-string
+        self._name: Tuple[str, ...] = tuple(NOTE_NAMES[m % 12] for m in range(128))
+        self._name_oct: Tuple[str, ...] = tuple(f"{NOTE_NAMES[m % 12]}{m // 12 - 1}" for m in range(128))
+        self._chord_table: List[Dict[str, Optional[str]]] = self._load_or_build_chord_table()
+
+    def _load_or_build_chord_table(self) -> List[Dict[str, Optional[str]]]:
+        """Load the precomputed chord table from disk, building it if necessary
+
+        Detection only depends on the 12-bit pitch-class mask, so all 4096
+        possible inputs are resolved once and cached to disk. Subsequent
+        launches load the table instead of re-running pychord.
+
+        Returns:
+            List[Dict[str, Optional[str]]]: Chord info for every 12-bit mask
+        """
+        try:
+            with open(_CHORD_TABLE_PATH, 'rb') as f:
+                version, table = pickle.load(f)
+            if version == _CHORD_TABLE_VERSION and len(table) == 4096:
+                return table
+        except Exception:
+            pass  # Missing or stale cache - rebuild below
+
+        print("🎼 Building chord lookup table (first run only, this takes a minute)...")
+        table = [_chord_from_mask(mask) for mask in range(4096)]
+
+        try:
+            os.makedirs(os.path.dirname(_CHORD_TABLE_PATH), exist_ok=True)
+            with open(_CHORD_TABLE_PATH, 'wb') as f:
+                pickle.dump((_CHORD_TABLE_VERSION, table), f)
+        except Exception as e:
+            print(f"⚠️ Could not cache chord table: {e}")
+
+        return table
     
     def midi_to_note_name(self, midi_note: int) -> str:
         """Convert MIDI note number to note name
@@ -24,7 +83,12 @@ class ChordDetector:
         Returns:
             str: Note name without octave (e.g., 'C', 'F#', 'Bb')
         """
-        return self.note_names[midi_note % 12]
+        # Notes outside MIDI range are still reachable (extreme tuning +
+        # octave shift); fall back to the modulo math so a negative note
+        # can't wrap the table from the wrong end
+        if 0 <= midi_note <= 127:
+            return self._name[midi_note]
+        return NOTE_NAMES[midi_note % 12]
     
     def midi_to_note_with_octave(self, midi_note: int) -> str:
         """Convert MIDI note number to note name with octave
@@ -35,9 +99,9 @@ class ChordDetector:
         Returns:
             str: Note name with octave (e.g., 'C4', 'F#3')
         """
-        note_name: str = self.note_names[midi_note % 12]
-        octave: int = (midi_note // 12) - 1
-        return f"{note_name}{octave}"
+        if 0 <= midi_note <= 127:
+            return self._name_oct[midi_note]
+        return f"{NOTE_NAMES[midi_note % 12]}{midi_note // 12 - 1}"
     
     def get_active_notes_info(self, active_notes: Dict[Tuple[int, int], int]) -> Dict[str, Any]:
         """Analyze currently active notes and detect chords
@@ -59,8 +123,13 @@ class ChordDetector:
         
         # Extract and analyze the notes
         midi_notes: List[int] = list(active_notes.values())
-        note_names: List[str] = [self.midi_to_note_name(note) for note in midi_notes]
-        note_names_with_octave: List[str] = [self.midi_to_note_with_octave(note) for note in midi_notes]
+        if all(0 <= note <= 127 for note in midi_notes):
+            note_names: List[str] = [self._name[note] for note in midi_notes]
+            note_names_with_octave: List[str] = [self._name_oct[note] for note in midi_notes]
+        else:
+            # Out-of-range note present - take the guarded per-note path
+            note_names = [self.midi_to_note_name(note) for note in midi_notes]
+            note_names_with_octave = [self.midi_to_note_with_octave(note) for note in midi_notes]
         
         chord_info: Dict[str, Optional[str]] = self._detect_chord(midi_notes)
         
@@ -74,82 +143,105 @@ class ChordDetector:
     
     def _detect_chord(self, midi_notes: List[int]) -> Dict[str, Optional[str]]:
         """Detect chord from MIDI notes using multiple strategies
-        
+
+        Detection only depends on the set of pitch classes, so the notes are
+        packed into a 12-bit mask that indexes the precomputed chord table.
+
         Args:
             midi_notes (List[int]): List of MIDI note numbers
-            
+
         Returns:
             Dict[str, Optional[str]]: Dictionary with 'name' and 'root' keys for detected chord
         """
         if len(midi_notes) < 2:
             return {'name': None, 'root': None}
-        
-        # Remove duplicate notes (same pitch class)
-        note_names: List[str] = list(set(self.midi_to_note_name(note) for note in midi_notes))
-        
-        if len(note_names) < 2:
-            return {'name': None, 'root': None}
-        
-        found_chords = []
-        
-        # Strategy 1: Try each note as potential root
+
+        # Pack unique pitch classes into a 12-bit mask (bit i = pitch class i)
+        mask: int = 0
+        for note in midi_notes:
+            mask |= 1 << (note % 12)
+
+        return self._chord_table[mask]
+
+
+def _mask_to_chromatic_names(mask: int) -> List[str]:
+    """Decode a 12-bit pitch-class mask into chromatically ordered note names
+
+    Iterating the bits low to high yields the names already sorted, so no
+    set/sort/index() round trip is needed.
+
+    Args:
+        mask (int): 12-bit pitch-class bitmask (bit i set = pitch class i present)
+
+    Returns:
+        List[str]: Note names in chromatic order
+    """
+    return [NOTE_NAMES[i] for i in range(12) if mask >> i & 1]
+
+
+def _chord_from_mask(mask: int) -> Dict[str, Optional[str]]:
+    """Detect a chord from a 12-bit pitch-class mask
+
+    Runs the full pychord strategy chain; only called while building the
+    4096-entry chord table, never from the per-frame path.
+
+    Args:
+        mask (int): 12-bit pitch-class bitmask (bit i set = pitch class i present)
+
+    Returns:
+        Dict[str, Optional[str]]: Dictionary with 'name' and 'root' keys for detected chord
+    """
+    # Fewer than two bits set means fewer than two pitch classes - bail out
+    # before even decoding the mask into names
+    if mask & (mask - 1) == 0:
+        return {'name': None, 'root': None}
+
+    note_names: List[str] = _mask_to_chromatic_names(mask)
+
+    # Strategy 1: Single call with the chromatically ordered notes - pychord
+    # already enumerates candidate roots internally
+    found_chords = find_chords_from_notes(note_names)
+
+    # Strategy 2: Only if that found nothing, retry with each note rotated to
+    # the front (catches orderings pychord misses for small sets)
+    if not found_chords and len(note_names) <= 5:
         for potential_root in note_names:
-            remaining_notes: List[str] = [n for n in note_names if n != potential_root]
-            ordered_notes: List[str] = [potential_root] + sorted(remaining_notes)
-            
-            chords = find_chords_from_notes(ordered_notes)
+            remaining_notes: List[str] = sorted(n for n in note_names if n != potential_root)
+            chords = find_chords_from_notes([potential_root] + remaining_notes)
             if chords:
                 found_chords.extend(chords)
-        
-        # Strategy 2: Try original note order
-        if not found_chords:
-            found_chords = find_chords_from_notes(note_names)
-        
-        # Strategy 3: Try chromatic ordering
-        if not found_chords:
-            chromatic_order: List[str] = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-            sorted_notes: List[str] = sorted(note_names, key=lambda x: chromatic_order.index(x))
-            found_chords = find_chords_from_notes(sorted_notes)
-        
-        if found_chords:
-            best_chord = found_chords[0]
-            return {
-                'name': str(best_chord),
-                'root': best_chord.root
-            }
-        
-        # Strategy 4: Try partial chord matching (for incomplete chords)
-        if len(note_names) >= 3:
-            for i, note_to_remove in enumerate(note_names):
-                subset: List[str] = note_names[:i] + note_names[i+1:]
-                subset_chords = find_chords_from_notes(subset)
-                
-                if subset_chords:
-                    best_chord = subset_chords[0]
-                    chord_components = best_chord.components()
-                    
-                    # Check if the removed note is actually part of this chord
-                    if note_to_remove in chord_components:
-                        return {
-                            'name': f"{str(best_chord)} (partial)",
-                            'root': best_chord.root
-                        }
-        
-        # Strategy 5: Power chord detection (root + fifth)
-        if len(note_names) == 2:
-            chromatic_notes: List[int] = sorted(set(note % 12 for note in midi_notes))
-            root, other = chromatic_notes
-            interval: int = (other - root) % 12
-            
-            # Perfect fifth is 7 semitones
-            if interval == 7:
-                root_name: str = self.note_names[root]
-                return {'name': f"{root_name}5", 'root': root_name}
-            
-            # Check inverted fifth
-            interval_inv: int = (root - other) % 12
-            if interval_inv == 7:
-                root_name = self.note_names[other]
-                return {'name': f"{root_name}5", 'root': root_name}
-        
-        return {'name': None, 'root': None}
\ No newline at end of file
+
+    if found_chords:
+        best_chord = found_chords[0]
+        return {
+            'name': str(best_chord),
+            'root': best_chord.root
+        }
+
+    # Strategy 4: Try partial chord matching (for incomplete chords)
+    if len(note_names) >= 3:
+        for i, note_to_remove in enumerate(note_names):
+            subset: List[str] = note_names[:i] + note_names[i+1:]
+            subset_chords = find_chords_from_notes(subset)
+
+            if subset_chords:
+                best_chord = subset_chords[0]
+                chord_components = best_chord.components()
+
+                # Check if the removed note is actually part of this chord
+                if note_to_remove in chord_components:
+                    return {
+                        'name': str(best_chord) + _PARTIAL,
+                        'root': best_chord.root
+                    }
+
+    # Strategy 5: Power chord detection (root + fifth) via the pair table
+    if len(note_names) == 2:
+        # Extract both pitch classes straight from the mask bits
+        low: int = (mask & -mask).bit_length() - 1           # lowest set bit
+        high: int = (mask & (mask - 1)).bit_length() - 1     # highest set bit
+        power = _POWER_CHORD[low][high]
+        if power is not None:
+            return dict(power)
+
+    return {'name': None, 'root': None}
\ No newline at end of file
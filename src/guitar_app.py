@@ -1,12 +1,16 @@
 """Main Guitar Application"""
 
 import pygame
-import sys
-from typing import Set, Tuple, List, Optional, Dict
+from typing import Tuple, List, Optional, Dict
 from .midi_controller import MidiController
 from .keyboard_mapping import KeyboardMapping
 from .guitar_display import GuitarDisplay
 
+# Resolved once at import so the key handler doesn't chase pygame module
+# attributes on every event
+K_ESCAPE: int = pygame.K_ESCAPE
+K_SPACE: int = pygame.K_SPACE
+
 
 class GuitarApp:
     """Main MIDI Guitar application
@@ -17,8 +21,20 @@ class GuitarApp:
     
     def __init__(self) -> None:
         """Initialize the application with pygame and all components"""
-        pygame.init()
-        
+        # Only bring up the subsystems the app uses - skips SDL mixer,
+        # joystick etc. and shaves dlopen/setup time off startup
+        pygame.display.init()
+        pygame.font.init()
+
+        # Drop events the app never handles (mouse motion, window/joystick
+        # noise) at the SDL layer so they are never allocated as Python objects
+        pygame.event.set_blocked(None)
+        # MOUSEWHEEL must stay allowed: pygame synthesizes the button-4/5
+        # MOUSEBUTTONDOWN events the wheel handler consumes from it
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                                  pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL,
+                                  pygame.WINDOWEXPOSED])
+
         # Display configuration
         self.WIDTH: int = 1200
         self.HEIGHT: int = 700
@@ -31,51 +47,117 @@ class GuitarApp:
         self.display: GuitarDisplay = GuitarDisplay(self.screen, self.keyboard_mapping)
         
         # Application state
-        self.pressed_keys: Set[int] = set()  # Currently pressed keyboard scancodes
-        self.clock: pygame.time.Clock = pygame.time.Clock()
+        self.pressed_keys: int = 0  # Bitmap of pressed scancodes (bit n = scancode n)
         self.current_octave: int = 0  # Octave offset (-3 to +3)
+        self._dirty: bool = True  # Redraw needed (state changed since last frame)
         self.sustain_mode: bool = True  # Notes sustain until new notes are played
         self.chord_mode: bool = False  # Allow multiple simultaneous notes
         
-        # Visual state - tracks only actively pressed notes for display
-        self.visual_notes: Dict[Tuple[int, int], int] = {}  # Only shows pressed keys
+        # Visual state - the active (highest) fret per string, maintained
+        # incrementally by the key handlers so the render loop just reads it
+        self.visual_notes: Dict[Tuple[int, int], int] = {}
+
+        # Chord info cache - re-run detection only when the note set changes
+        self._last_notes_key: Optional[frozenset] = None
+        self._last_chord_info: Optional[Dict] = None
         
         # String fret tracking - realistic guitar behavior
-        self.string_frets: Dict[int, Dict[int, int]] = {i: {} for i in range(4)}  # {string_index: {fret: midi_note}}
+        self.string_frets: List[Dict[int, int]] = [{} for _ in range(4)]  # per string: {fret: midi_note}
+        # Cached highest pressed fret per string, kept in sync by the key
+        # handlers so lookups are O(1) instead of max() over the dict keys
+        self._active_fret: List[Optional[int]] = [None] * 4
+        # Fret currently sounding per string (strings are monophonic), so the
+        # audio update never has to scan the controller's active notes
+        self._playing_fret: List[Optional[int]] = [None] * 4
+
+        # Dense scancode -> (string, fret, base_note, string_name) table so a
+        # key event is one indexed load instead of three mapping calls
+        self._kbd_tbl: List[Optional[Tuple[int, int, int, str]]] = []
+        self._rebuild_key_table()
+
+        # Event-type dispatch table for the main loop (handlers return False
+        # to quit the application, anything else to keep running)
+        self._event_handlers = {
+            pygame.QUIT: lambda event: False,
+            pygame.KEYDOWN: self.handle_key_down,
+            pygame.KEYUP: self._on_key_up,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_down,
+            pygame.WINDOWEXPOSED: self._on_window_exposed,
+        }
+
+        # Special-key dispatch for key-down events; unmapped keys fall through
+        # to the note-playing action
+        self._key_action = {
+            K_ESCAPE: self._quit_action,
+            K_SPACE: self._strum_action,
+        }
         
         # Initialize MIDI system
         if not self.midi_controller.initialize():
             print("⚠️ MIDI not available - notes will be printed to console")
+
+        # Instrument state is stable for the session - cache it here instead
+        # of re-querying the controller on every frame
+        self._instruments: Tuple[str, ...] = self.midi_controller.get_available_instruments()
+        self._current_instrument: str = self.midi_controller.get_current_instrument()
     
+    def _rebuild_key_table(self) -> None:
+        """Rebuild the dense scancode lookup table from the keyboard mapping
+
+        Called at startup and whenever a string's tuning changes, since the
+        table bakes in each string's base MIDI note.
+        """
+        mapping = self.keyboard_mapping
+        table: List[Optional[Tuple[int, int, int, str]]] = [None] * (max(mapping.scancode_mapping) + 1)
+        for scancode, (string_index, fret) in mapping.scancode_mapping.items():
+            table[scancode] = (
+                string_index,
+                fret,
+                mapping.string_base_notes[string_index] + fret,
+                mapping.string_names[string_index],
+            )
+        self._kbd_tbl = table
+
     def handle_key_down(self, event: pygame.event.Event) -> bool:
         """Handle keyboard key press events
-        
+
         Args:
             event (pygame.event.Event): Pygame key down event
-            
+
         Returns:
             bool: False if application should quit, True otherwise
         """
-        if event.key == pygame.K_ESCAPE:
-            return False
-        
-        if event.key == pygame.K_SPACE:
-            self.strum_all_strings()
-            return True
-        
+        return self._key_action.get(event.key, self._play_note_action)(event)
+
+    def _quit_action(self, event: pygame.event.Event) -> bool:
+        """Key action: quit the application"""
+        return False
+
+    def _strum_action(self, event: pygame.event.Event) -> bool:
+        """Key action: strum all held notes"""
+        self.strum_all_strings()
+        return True
+
+    def _play_note_action(self, event: pygame.event.Event) -> bool:
+        """Key action: press a fret (default for all mapped keys)
+
+        Args:
+            event (pygame.event.Event): Pygame key down event
+
+        Returns:
+            bool: True (playing a note never quits the app)
+        """
         scancode: int = event.scancode
-        if scancode in self.pressed_keys:
+        if self.pressed_keys & (1 << scancode):
             return True  # Key already pressed, ignore
-        
-        # Convert scancode to guitar position
-        position = self.keyboard_mapping.get_guitar_position(scancode)
-        if position is None:
+
+        # Convert scancode to guitar position via the dense lookup table
+        entry = self._kbd_tbl[scancode] if scancode < len(self._kbd_tbl) else None
+        if entry is None:
             return True  # Not a mapped key
-        
-        string_index, fret = position
-        
-        midi_note: int = self.keyboard_mapping.get_midi_note(string_index, fret, self.current_octave)
-        string_name: str = self.keyboard_mapping.get_string_name(string_index)
+
+        string_index, fret, base_note, string_name = entry
+        midi_note: int = base_note + 12 * self.current_octave
         
         # Check if there's already a higher fret pressed
         current_active_fret = self.get_active_fret_for_string(string_index)
@@ -83,14 +165,17 @@ class GuitarApp:
         
         # In sustain mode, only stop previous notes if this is the first key in a new chord
         # This allows chord sustain: if no keys are currently pressed, stop previous sustained notes
-        if self.sustain_mode and len(self.pressed_keys) == 0:
+        if self.sustain_mode and self.pressed_keys == 0:
             self.midi_controller.stop_all_notes()
+            self._playing_fret = [None] * 4
         
         # Always track this fret being pressed on this string (even if it won't sound immediately)
         self.string_frets[string_index][fret] = midi_note
-        self.pressed_keys.add(scancode)
-        self.visual_notes[(string_index, fret)] = midi_note
-        
+        if current_active_fret is None or fret > current_active_fret:
+            self._active_fret[string_index] = fret
+        self.pressed_keys |= 1 << scancode
+        self._dirty = True
+
         # Only update audio if this fret should sound (higher than current active fret)
         if should_play_immediately:
             self.update_string_audio(string_index)
@@ -103,21 +188,25 @@ class GuitarApp:
             event (pygame.event.Event): Pygame key up event
         """
         scancode: int = event.scancode
-        if scancode not in self.pressed_keys:
+        if not self.pressed_keys & (1 << scancode):
             return  # Key wasn't pressed by us
-        
-        position = self.keyboard_mapping.get_guitar_position(scancode)
-        if position is None:
+
+        entry = self._kbd_tbl[scancode] if scancode < len(self._kbd_tbl) else None
+        if entry is None:
             return  # Not a mapped key
-        
-        string_index, fret = position
+
+        string_index, fret = entry[0], entry[1]
         
         # Remove this fret from the string's pressed frets
         self.string_frets[string_index].pop(fret, None)
-        
-        # Always remove from visual display when key is released
-        self.visual_notes.pop((string_index, fret), None)
-        self.pressed_keys.discard(scancode)
+        if self._active_fret[string_index] == fret:
+            # Released the active fret - fall back to the next highest
+            self._active_fret[string_index] = max(self.string_frets[string_index], default=None)
+
+        # Always refresh the visual display when a key is released
+        self._refresh_visual_note(string_index)
+        self.pressed_keys &= ~(1 << scancode)
+        self._dirty = True
         
         # Update audio for this string (pull-off behavior)
         if not self.sustain_mode:
@@ -129,12 +218,8 @@ class GuitarApp:
             current_active_fret = self.get_active_fret_for_string(string_index)
             
             # Check what was playing before the key release
-            was_playing_released_fret = False
-            for fret_pos, midi_note in self.midi_controller.active_notes.items():
-                if fret_pos[0] == string_index and fret_pos[1] == fret:
-                    was_playing_released_fret = True
-                    break
-            
+            was_playing_released_fret = self._playing_fret[string_index] == fret
+
             if was_playing_released_fret:
                 # We released the fret that was actually playing, so update audio
                 if current_active_fret is None:
@@ -145,14 +230,41 @@ class GuitarApp:
                     self.update_string_audio(string_index)
             # If we released a fret that wasn't playing, don't update audio at all
     
+    def _on_key_up(self, event: pygame.event.Event) -> bool:
+        """Dispatch-table adapter for key releases"""
+        self.handle_key_up(event)
+        return True
+
+    def _on_window_exposed(self, event: pygame.event.Event) -> bool:
+        """Repaint everything after the window contents were lost
+
+        Restore/expose can hand us a stale backing store, and the
+        dirty-rect presentation only repairs regions whose state changes
+        - so force a full redraw and a full present.
+        """
+        self._dirty = True
+        self.display.invalidate()
+        return True
+
+    def _on_mouse_down(self, event: pygame.event.Event) -> bool:
+        """Dispatch-table adapter for mouse buttons (click and wheel)"""
+        if event.button == 1:  # Left mouse button
+            self.handle_mouse_click(event.pos)
+        elif event.button == 4:  # Mouse wheel up
+            self.handle_mouse_wheel(-1)
+        elif event.button == 5:  # Mouse wheel down
+            self.handle_mouse_wheel(1)
+        return True
+
     def handle_mouse_click(self, pos: Tuple[int, int]) -> None:
         """Handle mouse click events for UI interaction
         
         Args:
             pos (Tuple[int, int]): Mouse click position (x, y)
         """
-        instruments: List[str] = self.midi_controller.get_available_instruments()
-        
+        instruments: Tuple[str, ...] = self._instruments
+        self._dirty = True  # Clicks can toggle dropdowns/buttons, so always redraw
+
         # Check octave buttons first
         if self.display.handle_octave_buttons(pos):
             octave_change = self.display.get_octave_change()
@@ -172,14 +284,16 @@ class GuitarApp:
         if tuning_change:
             string_index, note_name, midi_note = tuning_change
             self.keyboard_mapping.set_string_tuning(string_index, midi_note, note_name)
+            self._rebuild_key_table()  # Base notes are baked into the key table
             current_tuning = self.keyboard_mapping.get_current_tuning_name()
             print(f"🎸 String {string_index} tuned to {note_name} (MIDI {midi_note}) - {current_tuning} tuning")
             return
         
         selected_instrument: Optional[str] = self.display.handle_dropdown_click(pos, instruments)
-        
+
         if selected_instrument:
-            self.midi_controller.set_instrument(selected_instrument)
+            if self.midi_controller.set_instrument(selected_instrument):
+                self._current_instrument = selected_instrument
     
     def handle_mouse_wheel(self, direction: int) -> None:
         """Handle mouse wheel scrolling for dropdown
@@ -189,6 +303,7 @@ class GuitarApp:
         """
         if self.display.dropdown_open:
             self.display.dropdown_scroll_offset += direction
+            self._dirty = True
             # Bounds checking is handled in the draw method
     
     def change_octave(self, direction: int) -> None:
@@ -201,20 +316,32 @@ class GuitarApp:
         # Limit octave range to reasonable values (-3 to +3)
         if -3 <= new_octave <= 3:
             self.current_octave = new_octave
+            self._dirty = True
             print(f"🎵 Octave changed to: {self.current_octave:+d}")
     
+    def _refresh_visual_note(self, string_index: int) -> None:
+        """Update the visual entry for a string to its active (highest) fret
+
+        Args:
+            string_index (int): String index (0-3)
+        """
+        for key in [k for k in self.visual_notes if k[0] == string_index]:
+            del self.visual_notes[key]
+
+        active_fret = self.get_active_fret_for_string(string_index)
+        if active_fret is not None:
+            self.visual_notes[(string_index, active_fret)] = self.string_frets[string_index][active_fret]
+
     def get_active_fret_for_string(self, string_index: int) -> Optional[int]:
         """Get the highest (active) fret being pressed on a string
-        
+
         Args:
             string_index (int): String index (0-3)
-            
+
         Returns:
             Optional[int]: Highest fret number, or None if no frets pressed
         """
-        if not self.string_frets[string_index]:
-            return None
-        return max(self.string_frets[string_index].keys())
+        return self._active_fret[string_index]
     
     def update_string_audio(self, string_index: int) -> None:
         """Update the audio for a string based on currently pressed frets
@@ -222,11 +349,14 @@ class GuitarApp:
         Args:
             string_index (int): String index (0-3)
         """
-        # Always stop any currently playing note on this string first
-        for fret_pos, midi_note in list(self.midi_controller.active_notes.items()):
-            if fret_pos[0] == string_index:  # fret_pos is (string_index, fret_number)
-                self.midi_controller.stop_note(fret_pos[0], fret_pos[1])
-        
+        self._dirty = True
+        self._refresh_visual_note(string_index)
+        # Always stop the note currently sounding on this string first
+        playing_fret = self._playing_fret[string_index]
+        if playing_fret is not None:
+            self.midi_controller.stop_note(string_index, playing_fret)
+            self._playing_fret[string_index] = None
+
         # Get the highest fret being pressed on this string
         active_fret = self.get_active_fret_for_string(string_index)
         if active_fret is not None:
@@ -234,6 +364,7 @@ class GuitarApp:
             midi_note = self.string_frets[string_index][active_fret]
             string_name = self.keyboard_mapping.get_string_name(string_index)
             self.midi_controller.play_note(string_index, active_fret, midi_note, string_name)
+            self._playing_fret[string_index] = active_fret
     
     def strum_all_strings(self) -> None:
         """Strum all strings - replay all currently pressed notes
@@ -242,29 +373,20 @@ class GuitarApp:
         """
         print("🎸 Strumming all strings...")
         
-        # Go through each string and replay the active note if there is one
+        # Collect the re-strikes and submit them as one chord batch so the
+        # controller sends a single MIDI write for the whole strum
+        chord_events: List[Tuple[int, int, int, int]] = []
         for string_index in range(4):  # 4 strings: G, D, A, E
             active_fret = self.get_active_fret_for_string(string_index)
             if active_fret is not None:
-                # There's a fret pressed on this string, replay it
+                # Re-strike: stop the sounding note (if any) before replaying
+                playing_fret = self._playing_fret[string_index]
+                if playing_fret is not None:
+                    self.midi_controller.stop_note(string_index, playing_fret)
                 midi_note = self.string_frets[string_index][active_fret]
-                string_name = self.keyboard_mapping.get_string_name(string_index)
-                self.midi_controller.play_note(string_index, active_fret, midi_note, string_name)
-    
-    def get_visual_notes(self) -> Dict[Tuple[int, int], int]:
-        """Get notes that should be visually displayed (only active frets per string)
-        
-        Returns:
-            Dict[Tuple[int, int], int]: Dictionary of (string_index, fret) -> midi_note for visual display
-        """
-        visual_notes = {}
-        for string_index in range(4):  # 4 strings
-            active_fret = self.get_active_fret_for_string(string_index)
-            if active_fret is not None:
-                # Only show the active (highest) fret for each string
-                midi_note = self.string_frets[string_index][active_fret]
-                visual_notes[(string_index, active_fret)] = midi_note
-        return visual_notes
+                chord_events.append((string_index, active_fret, midi_note, 100))
+                self._playing_fret[string_index] = active_fret
+        self.midi_controller.play_chord(chord_events)
     
     def run(self) -> None:
         """Main application loop. Handles events, updates display, and maintains 60 FPS."""
@@ -281,39 +403,40 @@ class GuitarApp:
         
         running: bool = True
         while running:
-            self.clock.tick(60)  # Maintain 60 FPS
-            
-            # Process all pygame events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            # Block until an event arrives (or ~1 frame passes) instead of
+            # busy-polling at 60 FPS - idle CPU drops to near zero
+            first_event = pygame.event.wait(16)
+            events = pygame.event.get()
+            if first_event.type != pygame.NOEVENT:
+                events.insert(0, first_event)
+
+            # Process all pygame events through the dispatch table
+            for event in events:
+                handler = self._event_handlers.get(event.type)
+                if handler is not None and handler(event) is False:
                     running = False
-                elif event.type == pygame.KEYDOWN:
-                    if not self.handle_key_down(event):
-                        running = False
-                elif event.type == pygame.KEYUP:
-                    self.handle_key_up(event)
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left mouse button
-                        self.handle_mouse_click(event.pos)
-                    elif event.button == 4:  # Mouse wheel up
-                        self.handle_mouse_wheel(-1)
-                    elif event.button == 5:  # Mouse wheel down
-                        self.handle_mouse_wheel(1)
-            
+
+            # Only redraw when state changed (dropdowns track mouse hover, so
+            # keep redrawing while one is open)
+            if not (self._dirty or self.display.dropdown_open or self.display.tuning_dropdown_open):
+                continue
+            self._dirty = False
+
             # Render everything
             self.screen.fill((0, 0, 0))  # Clear to black
             
-            # Get visual notes (only active frets per string for realistic guitar behavior)
-            current_visual_notes = self.get_visual_notes()
-            self.display.draw_guitar_neck(current_visual_notes)
+            # Visual notes hold only active frets per string (maintained
+            # incrementally); chord detection re-runs only when they change
+            current_visual_notes = self.visual_notes
+            notes_key = frozenset(current_visual_notes.items())
+            if notes_key != self._last_notes_key:
+                self._last_chord_info = self.display.compute_chord_info(current_visual_notes)
+                self._last_notes_key = notes_key
+            self.display.draw_neck_and_active(current_visual_notes, self._last_chord_info)
             self.display.draw_layout_info()
-            # Use visual notes for chord detection (only active frets)
-            self.display.draw_active_notes(current_visual_notes)
             
-            # Draw instrument selection dropdown
-            instruments: List[str] = self.midi_controller.get_available_instruments()
-            current_instrument: str = self.midi_controller.get_current_instrument()
-            self.display.draw_instrument_dropdown(instruments, current_instrument)
+            # Draw instrument selection dropdown (cached - stable for the session)
+            self.display.draw_instrument_dropdown(self._instruments, self._current_instrument)
             
             # Draw octave controls
             self.display.draw_octave_controls(self.current_octave)
@@ -324,8 +447,12 @@ class GuitarApp:
             # Draw tuning dropdown if open
             if self.display.tuning_dropdown_open:
                 self.display.draw_tuning_dropdown_with_mapping(self.keyboard_mapping)
-            
-            pygame.display.flip()
+
+            # Present only the regions whose inputs changed - the redraw
+            # above is deterministic, so unchanged regions already match
+            # what is on screen
+            pygame.display.update(self.display.collect_dirty_rects(
+                notes_key, self.current_octave, self.sustain_mode, self._current_instrument))
         
         self.cleanup()
     
@@ -337,6 +464,8 @@ class GuitarApp:
 
 def main() -> None:
     """Application entry point with error handling"""
+    import sys
+
     try:
         app: GuitarApp = GuitarApp()
         app.run()
@@ -2,6 +2,7 @@
 Guitar Display - Handles the visual representation of the guitar
 """
 import pygame
+from collections import OrderedDict
 from typing import Dict, Tuple, Optional, List
 from .keyboard_mapping import KeyboardMapping
 from .chord_detector import ChordDetector
@@ -9,7 +10,33 @@ from .chord_detector import ChordDetector
 
 class GuitarDisplay:
     """Handles the visual guitar interface"""
-    
+
+    # Fixed attribute layout - slot offsets are cheaper than dict-based
+    # attribute access in the per-frame draw paths
+    __slots__ = (
+        'screen', 'mapping', 'chord_detector',
+        'BLACK', 'WHITE', 'RED', 'GREEN', 'GRAY', 'YELLOW', 'BLUE',
+        'ORANGE', 'PURPLE', 'LIGHT_GRAY', 'DARK_GRAY', '_string_colors',
+        'font', 'small_font', 'tiny_font', 'large_font', 'chord_font',
+        'dropdown_open', 'dropdown_rect', 'dropdown_options_rect',
+        'dropdown_scroll_offset', 'dropdown_item_height', 'dropdown_visible_items',
+        'help_visible', 'help_button_rect',
+        'octave_up_rect', 'octave_down_rect', 'octave_change',
+        'sustain_button_rect',
+        'string_rects', 'tuning_dropdown_open', 'selected_string_index', 'tuning_dropdown_rect',
+        '_text_cache', '_text_cache_max', '_blit_batch',
+        '_region_states', '_neck_region', '_help_button_region', '_help_overlay_region',
+        '_dropdown_region', '_octave_region', '_sustain_region',
+        '_dropdown_panel_key', '_dropdown_panel',
+        '_arrow_up_points', '_arrow_down_points', '_scroll_up_points', '_scroll_down_points',
+        '_last_notes_key', '_last_notes_info',
+        '_help_overlay', '_help_rect',
+        '_hb_bounds', '_dd_bounds', '_ddo_bounds', '_help_bounds',
+        '_geometry_frets', '_geometry_names', '_string_ys', '_fret_xs',
+        '_string_line_endpoints', '_fret_line_endpoints', '_string_name_rects',
+        '_fret_center_x', '_string_line_rects', '_neck_bg',
+    )
+
     def __init__(self, screen: pygame.Surface, mapping: KeyboardMapping) -> None:
         self.screen = screen
         self.mapping = mapping
@@ -27,6 +54,9 @@ class GuitarDisplay:
         self.PURPLE = (160, 80, 200)
         self.LIGHT_GRAY = (200, 200, 200)
         self.DARK_GRAY = (64, 64, 64)
+
+        # Sidebar note color per string, indexed directly
+        self._string_colors: Tuple[Tuple[int, int, int], ...] = (self.RED, self.BLUE, self.GREEN, self.PURPLE)
         
         # Fonts
         self.font = pygame.font.Font(None, 36)
@@ -56,72 +86,330 @@ class GuitarDisplay:
         self.sustain_button_rect = pygame.Rect(400, 20, 80, 30)
         
         # String tuning state
-        self.string_rects: List[pygame.Rect] = []  # Will be set in draw_guitar_neck
+        self.string_rects: List[pygame.Rect] = []  # Set from the precomputed name rects each draw
         self.tuning_dropdown_open = False
         self.selected_string_index = -1
         self.tuning_dropdown_rect = pygame.Rect(0, 0, 150, 0)  # Dynamic size
-    
-    def draw_guitar_neck(self, active_notes: Dict[Tuple[int, int], int]) -> None:
-        """Draw the guitar neck with active frets highlighted.
-        
+
+        # Rendered-text cache - font rasterization is one of pygame's slowest
+        # calls and most UI text is identical frame to frame. LRU-bounded so
+        # dynamic strings (chord names etc.) can't grow it without limit.
+        self._text_cache: "OrderedDict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface]" = OrderedDict()
+        self._text_cache_max: int = 256
+
+        # Warm the cache with the fret numbers so the first frame pays nothing
+        for fret in range(10):
+            self._render(self.tiny_font, str(fret), self.WHITE)
+            self._render(self.tiny_font, str(fret), self.BLACK)
+
+        # Dirty-rect presentation state. Redraws are deterministic, so a
+        # region whose inputs are unchanged re-renders identical pixels and
+        # never needs to be pushed to the screen again - collect_dirty_rects
+        # compares per-region state and returns only the rects that changed.
+        self._region_states: Dict[str, object] = {}
+        # Union of everything each draw method touches, per region
+        self._neck_region = pygame.Rect(0, 90, screen.get_width(), 420)
+        self._help_button_region = pygame.Rect(45, 15, 90, 40)
+        self._help_overlay_region = pygame.Rect(148, 198, 604, 304)
+        self._dropdown_region = self.dropdown_rect.union(self.dropdown_options_rect)
+        self._octave_region = pygame.Rect(145, 15, 290, 50)
+        self._sustain_region = pygame.Rect(395, 15, 95, 60)
+
+        # Dropdown options panel memo - rebuilt only when the scroll
+        # position, selection or instrument list changes
+        self._dropdown_panel_key: Optional[Tuple] = None
+        self._dropdown_panel: Optional[pygame.Surface] = None
+
+        # Dropdown arrow and scroll-indicator vertices are fixed by the
+        # dropdown rects, so triangulate them once
+        arrow_x = self.dropdown_rect.right - 15
+        arrow_y = self.dropdown_rect.centery
+        self._arrow_up_points: Tuple[Tuple[int, int], ...] = (
+            (arrow_x, arrow_y + 3), (arrow_x + 5, arrow_y - 3), (arrow_x + 10, arrow_y + 3))
+        self._arrow_down_points: Tuple[Tuple[int, int], ...] = (
+            (arrow_x, arrow_y - 3), (arrow_x + 5, arrow_y + 3), (arrow_x + 10, arrow_y - 3))
+        up_rect = pygame.Rect(self.dropdown_options_rect.right - 15, self.dropdown_options_rect.y + 2, 10, 8)
+        down_rect = pygame.Rect(self.dropdown_options_rect.right - 15, self.dropdown_options_rect.bottom - 10, 10, 8)
+        self._scroll_up_points: Tuple[Tuple[int, int], ...] = (
+            (up_rect.centerx, up_rect.y), (up_rect.left, up_rect.bottom), (up_rect.right, up_rect.bottom))
+        self._scroll_down_points: Tuple[Tuple[int, int], ...] = (
+            (down_rect.centerx, down_rect.bottom), (down_rect.left, down_rect.y), (down_rect.right, down_rect.y))
+
+        # Chord-info memo - detection reruns only when the note set changes
+        self._last_notes_key: Optional[Tuple[int, ...]] = None
+        self._last_notes_info: Optional[Dict] = None
+
+        # The help overlay is fully static, so it is composed once here
+        # (background, title and key table) and drawn as a single blit.
+        # Its rect is shared between drawing and click handling so the
+        # hit-test can never drift from what is on screen.
+        self._help_rect = pygame.Rect(150, 200, 600, 300)
+        self._help_overlay: pygame.Surface = self._build_help_overlay()
+
+        # Click-path hit-test bounds as plain (left, top, right, bottom)
+        # tuples - inline comparisons skip the collidepoint method call
+        self._hb_bounds: Tuple[int, int, int, int] = (
+            self.help_button_rect.left, self.help_button_rect.top,
+            self.help_button_rect.right, self.help_button_rect.bottom)
+        self._dd_bounds: Tuple[int, int, int, int] = (
+            self.dropdown_rect.left, self.dropdown_rect.top,
+            self.dropdown_rect.right, self.dropdown_rect.bottom)
+        self._ddo_bounds: Tuple[int, int, int, int] = (
+            self.dropdown_options_rect.left, self.dropdown_options_rect.top,
+            self.dropdown_options_rect.right, self.dropdown_options_rect.bottom)
+        self._help_bounds: Tuple[int, int, int, int] = (
+            self._help_rect.left, self._help_rect.top,
+            self._help_rect.right, self._help_rect.bottom)
+
+        # Static neck geometry - none of these pixel positions change
+        # between frames, so they are computed once here (and again only
+        # if the fret count ever changes)
+        self._build_neck_geometry()
+
+        # Batched blitting: fblits (pygame >= 2.1.4) takes the whole
+        # (surface, dest) sequence in one C call; fall back to blits on
+        # older pygame
+        if hasattr(screen, 'fblits'):
+            self._blit_batch = screen.fblits
+        else:
+            self._blit_batch = lambda seq: screen.blits(seq, doreturn=False)
+
+    def _mark_region(self, name: str, state: object, rect: pygame.Rect, dirty: List[pygame.Rect]) -> None:
+        """Append rect to dirty if the region's state changed since last frame
+
         Args:
-            active_notes (Dict[Tuple[int, int], int]): Dictionary mapping (string, fret) to MIDI note numbers
+            name (str): Region identifier
+            state (object): Current value of everything the region draws from
+            rect (pygame.Rect): Screen area the region occupies
+            dirty (List[pygame.Rect]): Dirty-rect list being collected
+        """
+        if name not in self._region_states or self._region_states[name] != state:
+            self._region_states[name] = state
+            dirty.append(rect)
+
+    def collect_dirty_rects(self, notes_key: frozenset, current_octave: int,
+                            sustain_mode: bool, current_instrument: str) -> List[pygame.Rect]:
+        """Return the screen rects that changed since the last presented frame
+
+        Called after the backbuffer has been fully redrawn; the result is
+        passed to pygame.display.update() so only changed regions are
+        pushed to the screen instead of flipping the whole frame.
+
+        Args:
+            notes_key (frozenset): Frozen (string, fret) -> note items of the visual notes
+            current_octave (int): Current octave offset
+            sustain_mode (bool): Current sustain mode state
+            current_instrument (str): Name of the current instrument
+
+        Returns:
+            List[pygame.Rect]: Regions to present (whole screen on first call)
+        """
+        # First frame: present everything (but still record region states
+        # below so later diffs start from a known baseline)
+        full = not self._region_states
+        dirty: List[pygame.Rect] = []
+
+        self._mark_region('neck', (notes_key, self.tuning_dropdown_open, self.selected_string_index),
+                          self._neck_region, dirty)
+        self._mark_region('help_button', self.help_visible, self._help_button_region, dirty)
+        self._mark_region('help_overlay', self.help_visible, self._help_overlay_region, dirty)
+        self._mark_region('dropdown', (self.dropdown_open, self.dropdown_scroll_offset, current_instrument),
+                          self._dropdown_region, dirty)
+        self._mark_region('octave', current_octave, self._octave_region, dirty)
+        self._mark_region('sustain', sustain_mode, self._sustain_region, dirty)
+
+        # The tuning dropdown highlights the hovered row, so repaint its
+        # area every frame while it is open (closing is covered by the
+        # neck region's state change)
+        if self.tuning_dropdown_open:
+            dirty.append(self.tuning_dropdown_rect.inflate(4, 4))
+
+        if full:
+            return [self.screen.get_rect()]
+        return dirty
+
+    def invalidate(self) -> None:
+        """Forget the tracked region states so the next frame presents everything
+
+        Needed when the window contents are lost outside our control
+        (expose/restore on backends that don't preserve them) - partial
+        updates can only repair regions whose state changes.
+        """
+        self._region_states.clear()
+
+    def _build_neck_geometry(self) -> None:
+        """Precompute the immutable pixel positions of the neck drawing
+
+        String y-coordinates, fret x-coordinates, line endpoints, name
+        rects and pressed-circle centers only depend on the (fixed) layout
+        constants and the fret count, so they are built once instead of
+        being recomputed in every draw call.
         """
         start_x = 80
         start_y = 120
         string_spacing = 60
         fret_width = 80
-        
-        # Get number of frets from mapping
+        num_strings = len(self.mapping.string_names)
         num_frets = len(self.mapping.keyboard_columns)
-        
-        # Reset string rects for click detection
-        self.string_rects = []
-        
-        # Draw strings
-        for i in range(len(self.mapping.string_names)):
-            y = start_y + i * string_spacing
-            color = self.RED if any(key[0] == i for key in active_notes.keys()) else self.GRAY
-            # Adjust string length to match actual frets
-            pygame.draw.line(self.screen, color, (start_x, y), (start_x + fret_width * (num_frets - 1), y), 4)
-            
-            # Clickable string name with background
-            string_rect = pygame.Rect(5, y - 15, 40, 25)
-            self.string_rects.append(string_rect)
-            
-            # Highlight if this string's tuning dropdown is open
-            bg_color = self.BLUE if (self.tuning_dropdown_open and self.selected_string_index == i) else self.DARK_GRAY
-            pygame.draw.rect(self.screen, bg_color, string_rect)
+        self._geometry_frets: int = num_frets
+
+        self._string_ys: List[int] = [start_y + i * string_spacing for i in range(num_strings)]
+        self._fret_xs: List[int] = [start_x + f * fret_width for f in range(num_frets)]
+        self._string_line_endpoints: List[Tuple[Tuple[int, int], Tuple[int, int]]] = [
+            ((start_x, y), (start_x + fret_width * (num_frets - 1), y)) for y in self._string_ys
+        ]
+        self._fret_line_endpoints: List[Tuple[Tuple[int, int], Tuple[int, int]]] = [
+            ((x, start_y), (x, start_y + (num_strings - 1) * string_spacing)) for x in self._fret_xs
+        ]
+        # String-name click targets are fixed too
+        self._string_name_rects: List[pygame.Rect] = [
+            pygame.Rect(5, y - 15, 40, 25) for y in self._string_ys
+        ]
+        # X center of the pressed-note circle for each fret (fret 0 = open string)
+        self._fret_center_x: List[int] = [
+            start_x - 25 if f == 0 else int(start_x + (f - 0.5) * fret_width) for f in range(num_frets)
+        ]
+
+        # Active-string overlay rects - the red lines are axis-aligned, so
+        # per frame they are plain fill() calls on precomputed rects
+        # instead of draw.line endpoint math
+        self._string_line_rects: List[pygame.Rect] = [
+            pygame.Rect(start_x, y - 1, fret_width * (num_frets - 1), 4) for y in self._string_ys
+        ]
+
+        # Everything static about the neck (gray strings, fret lines, fret
+        # numbers, string-name buttons) composed into one background
+        # surface, blitted at (0, 90). Names are baked in, so the tuple is
+        # kept to trigger a rebuild when a tuning change renames a string.
+        self._geometry_names: Tuple[str, ...] = tuple(self.mapping.string_names)
+        bg = pygame.Surface((self.screen.get_width(), 420), pygame.SRCALPHA)
+        bg_y = 90
+        for (x1, y1), (x2, y2) in self._string_line_endpoints:
+            pygame.draw.line(bg, self.GRAY, (x1, y1 - bg_y), (x2, y2 - bg_y), 4)
+        for i, rect in enumerate(self._string_name_rects):
+            local_rect = rect.move(0, -bg_y)
+            pygame.draw.rect(bg, self.DARK_GRAY, local_rect)
+            pygame.draw.rect(bg, self.WHITE, local_rect, 1)
+            text = self._render(self.small_font, self.mapping.string_names[i], self.WHITE)
+            bg.blit(text, text.get_rect(center=local_rect.center))
+        for fret, ((x1, y1), (x2, y2)) in enumerate(self._fret_line_endpoints):
+            pygame.draw.line(bg, self.WHITE, (x1, y1 - bg_y), (x2, y2 - bg_y), 2)
+            bg.blit(self._render(self.tiny_font, str(fret), self.WHITE), (x1 - 5, y1 - 20 - bg_y))
+        self._neck_bg: pygame.Surface = bg
+
+    def _render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text through the cache, rasterizing only on first use
+
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (str): Text to render
+            color (Tuple[int, int, int]): Text color
+
+        Returns:
+            pygame.Surface: Cached rendered text surface
+        """
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > self._text_cache_max:
+                self._text_cache.popitem(last=False)  # Evict least recently used
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+    
+    def draw_neck_and_active(self, active_notes: Dict[Tuple[int, int], int], notes_info: Dict) -> None:
+        """Draw the guitar neck and active-note information in a single pass.
+
+        The neck's pressed-fret dots and the sidebar's individual-note list
+        both come from the same dict, so they are drawn in one fused walk
+        over active_notes instead of two separate iterations.
+
+        Args:
+            active_notes (Dict[Tuple[int, int], int]): Dictionary mapping (string, fret) to MIDI note numbers
+            notes_info (Dict): Result of a previous compute_chord_info call
+        """
+        # Rebuild geometry + background if the fret count or a string name
+        # ever changes
+        if (len(self.mapping.keyboard_columns) != self._geometry_frets
+                or tuple(self.mapping.string_names) != self._geometry_names):
+            self._build_neck_geometry()
+
+        # Hot locals - skips repeated attribute lookups in the loops below
+        screen = self.screen
+        render = self._render
+        tiny = self.tiny_font
+        draw_circle = pygame.draw.circle
+
+        # Bitmask of strings with at least one pressed fret - computed
+        # once, O(notes), instead of scanning active_notes per string
+        active_mask = 0
+        for string_index, _fret in active_notes:
+            active_mask |= 1 << string_index
+
+        # Click targets for the string names (precomputed rects)
+        self.string_rects = self._string_name_rects
+
+        # Static neck (gray strings, frets, numbers, name buttons) is one blit
+        screen.blit(self._neck_bg, (0, 90))
+
+        # Text is collected here and submitted as one batched blit call at
+        # the end instead of one screen.blit per glyph
+        blit_seq: List[Tuple[pygame.Surface, object]] = []
+
+        # Overlay the red line for strings that are sounding (axis-aligned,
+        # so a rect fill replaces the draw.line call)
+        fill = screen.fill
+        mask = active_mask
+        while mask:
+            lowest = mask & -mask  # Lowest set bit = next active string
+            fill(self.RED, self._string_line_rects[lowest.bit_length() - 1])
+            mask ^= lowest
+
+        # Highlight the string whose tuning dropdown is open
+        if self.tuning_dropdown_open and 0 <= self.selected_string_index < len(self._string_name_rects):
+            string_rect = self._string_name_rects[self.selected_string_index]
+            pygame.draw.rect(self.screen, self.BLUE, string_rect)
             pygame.draw.rect(self.screen, self.WHITE, string_rect, 1)
-            
-            text = self.small_font.render(self.mapping.string_names[i], True, self.WHITE)
-            text_rect = text.get_rect(center=string_rect.center)
-            self.screen.blit(text, text_rect)
-        
-        # Draw frets (fret lines between the actual fret positions)
-        for fret in range(num_frets):  # 0-9 frets
-            x = start_x + fret * fret_width
-            pygame.draw.line(self.screen, self.WHITE, (x, start_y), 
-                           (x, start_y + (len(self.mapping.string_names)-1) * string_spacing), 2)
-            
-            # Fret numbers
-            text = self.tiny_font.render(str(fret), True, self.WHITE)
-            self.screen.blit(text, (x - 5, start_y - 20))
-        
-        # Draw pressed frets
-        for (string_index, fret) in active_notes.keys():
-            if fret == 0:
-                x = start_x - 25  # Open string position
-            else:
-                # Position between fret lines (fret N is between line N-1 and N)
-                x = start_x + (fret - 0.5) * fret_width
-            y = start_y + string_index * string_spacing
-            pygame.draw.circle(self.screen, self.YELLOW, (int(x), y), 18)
-            
+            text = self._render(self.small_font, self.mapping.string_names[self.selected_string_index], self.WHITE)
+            blit_seq.append((text, text.get_rect(center=string_rect.center)))
+
+        # Chord information in the right sidebar
+        sidebar_x = 850
+        sidebar_y = 120
+        self._draw_chord_display(sidebar_x, sidebar_y, notes_info)
+
+        notes_y = sidebar_y + 120
+        if active_notes:
+            title = self._render(self.small_font, "Individual Notes:", self.WHITE)
+            blit_seq.append((title, (sidebar_x, notes_y)))
+
+        # Fused walk: each pressed fret gets its neck dot and sidebar entry
+        # in the same iteration
+        string_colors = self._string_colors
+        string_names = self.mapping.string_names
+        midi_name = self.chord_detector.midi_to_note_with_octave
+        fret_center_x = self._fret_center_x
+        string_ys = self._string_ys
+        append = blit_seq.append
+        for i, ((string_index, fret), midi_note) in enumerate(active_notes.items()):
+            # Precomputed circle center (fret 0 = open-string position)
+            x = fret_center_x[fret]
+            y = string_ys[string_index]
+            draw_circle(screen, self.YELLOW, (x, y), 18)
+
             # Fret number on circle
-            fret_text = self.tiny_font.render(str(fret), True, self.BLACK)
-            text_rect = fret_text.get_rect(center=(int(x), y))
-            self.screen.blit(fret_text, text_rect)
+            fret_text = render(tiny, str(fret), self.BLACK)
+            append((fret_text, fret_text.get_rect(center=(x, y))))
+
+            # Sidebar entry, color coded by string
+            note_name = midi_name(midi_note)
+            color = string_colors[string_index] if string_index < len(string_colors) else self.WHITE
+            note_text = render(tiny, f"{string_names[string_index]} F{fret}: {note_name}", color)
+            append((note_text, (sidebar_x + 20, notes_y + 25 + i * 18)))
+
+        self._blit_batch(blit_seq)
     
     def draw_layout_info(self) -> None:
         """Draw help button and ESC instruction at bottom"""
@@ -129,7 +417,7 @@ class GuitarDisplay:
         self.draw_help_button()
         
         # ESC instruction at bottom of screen
-        esc_text = self.small_font.render("Press ESC to quit", True, self.GRAY)
+        esc_text = self._render(self.small_font, "Press ESC to quit", self.GRAY)
         screen_height = self.screen.get_height()
         self.screen.blit(esc_text, (50, screen_height - 30))
         
@@ -146,41 +434,28 @@ class GuitarDisplay:
         
         # Help button text
         help_text = "Help" if not self.help_visible else "Hide"
-        text = self.small_font.render(help_text, True, self.WHITE)
+        text = self._render(self.small_font, help_text, self.WHITE)
         text_rect = text.get_rect(center=self.help_button_rect.center)
         self.screen.blit(text, text_rect)
     
-    def draw_help_overlay(self) -> None:
-        """Draw the keyboard layout help overlay"""
-        # Semi-transparent background
-        overlay = pygame.Surface((600, 300))
-        overlay.set_alpha(240)
-        overlay.fill(self.BLACK)
-        self.screen.blit(overlay, (150, 200))
-        
-        # Border
-        pygame.draw.rect(self.screen, self.WHITE, (150, 200, 600, 300), 2)
-        
-        # Title
-        title = self.font.render("🎸 Keyboard Layout (Each Column = Fret)", True, self.WHITE)
-        self.screen.blit(title, (170, 220))
-        
-        # Show the key mapping table
-        self._draw_keyboard_table_overlay(250)
-    
-    def _draw_keyboard_table(self, y_start: int) -> None:
-        """Draw keyboard layout as a properly aligned table.
-        
-        Args:
-            y_start (int): Y coordinate to start drawing the table
+    def _build_help_overlay(self) -> pygame.Surface:
+        """Compose the static help overlay into an off-screen Surface
+
+        The semi-transparent background, title and keyboard table never
+        change, so they are rendered once instead of being rebuilt (and
+        the 600x300 background refilled) every visible frame.
+
+        Returns:
+            pygame.Surface: Ready-to-blit overlay surface
         """
-        # Table configuration
-        start_x = 70
-        col_width = 35  # Fixed width for each column
-        row_height = 20
-        
-        # Table headers and data
-        headers = ["", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
+        overlay = pygame.Surface((600, 300), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 240))
+
+        # Title (coordinates relative to the overlay's (150, 200) position)
+        title = self._render(self.font, "🎸 Keyboard Layout (Each Column = Fret)", self.WHITE)
+        overlay.blit(title, (20, 20))
+
+        # Keyboard layout table
         rows = [
             ["Fret:", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"],
             ["G:", "1", "2", "3", "4", "5", "6", "7", "8", "9", "0"],
@@ -188,13 +463,11 @@ class GuitarDisplay:
             ["A:", "A", "S", "D", "F", "G", "H", "J", "K", "L", ";"],
             ["E:", "Z", "X", "C", "V", "B", "N", "M", ",", ".", "/"]
         ]
-        
-        # Draw each row
         for row_idx, row_data in enumerate(rows):
-            y = y_start + row_idx * row_height
+            y = 50 + row_idx * 20
             for col_idx, cell_text in enumerate(row_data):
-                x = start_x + col_idx * col_width
-                
+                x = 40 + col_idx * 35
+
                 # Different color for headers vs data
                 if row_idx == 0:  # Header row
                     color = self.YELLOW
@@ -202,22 +475,30 @@ class GuitarDisplay:
                     color = self.GREEN
                 else:  # Key data
                     color = self.WHITE
-                
-                text = self.tiny_font.render(cell_text, True, color)
-                self.screen.blit(text, (x, y))
+
+                overlay.blit(self._render(self.tiny_font, cell_text, color), (x, y))
+
+        return overlay
+
+    def draw_help_overlay(self) -> None:
+        """Draw the keyboard layout help overlay"""
+        # Pre-composed overlay - one blit plus the border
+        self.screen.blit(self._help_overlay, self._help_rect.topleft)
+        pygame.draw.rect(self.screen, self.WHITE, self._help_rect, 2)
     
-    def _draw_keyboard_table_overlay(self, y_start: int) -> None:
-        """Draw keyboard layout table in help overlay.
+    def _draw_keyboard_table(self, y_start: int) -> None:
+        """Draw keyboard layout as a properly aligned table.
         
         Args:
             y_start (int): Y coordinate to start drawing the table
         """
-        # Table configuration (adjusted for overlay)
-        start_x = 190
-        col_width = 35
+        # Table configuration
+        start_x = 70
+        col_width = 35  # Fixed width for each column
         row_height = 20
         
-        # Table data
+        # Table headers and data
+        headers = ["", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
         rows = [
             ["Fret:", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9"],
             ["G:", "1", "2", "3", "4", "5", "6", "7", "8", "9", "0"],
@@ -226,7 +507,8 @@ class GuitarDisplay:
             ["E:", "Z", "X", "C", "V", "B", "N", "M", ",", ".", "/"]
         ]
         
-        # Draw each row
+        # Draw each row, collecting every cell into one batched blit call
+        blit_seq: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
         for row_idx, row_data in enumerate(rows):
             y = y_start + row_idx * row_height
             for col_idx, cell_text in enumerate(row_data):
@@ -240,28 +522,31 @@ class GuitarDisplay:
                 else:  # Key data
                     color = self.WHITE
                 
-                text = self.tiny_font.render(cell_text, True, color)
-                self.screen.blit(text, (x, y))
+                blit_seq.append((self._render(self.tiny_font, cell_text, color), (x, y)))
+        self._blit_batch(blit_seq)
     
-    def draw_active_notes(self, active_notes: Dict[Tuple[int, int], int]) -> None:
-        """Draw currently active notes and chord information.
-        
+    def compute_chord_info(self, active_notes: Dict[Tuple[int, int], int]) -> Dict:
+        """Run chord detection for the given active notes.
+
+        Split out from drawing so callers can cache the result while the
+        note set is unchanged and skip re-detection on every frame.
+
         Args:
             active_notes (Dict[Tuple[int, int], int]): Dictionary mapping (string, fret) to MIDI note numbers
+
+        Returns:
+            Dict: Dictionary containing note information and chord analysis
         """
-        # Get chord analysis
-        notes_info = self.chord_detector.get_active_notes_info(active_notes)
-        
-        # Position in the right sidebar
-        x_start = 850
-        y_start = 120
-        
-        # Draw chord information prominently
-        self._draw_chord_display(x_start, y_start, notes_info)
-        
-        # Draw individual notes below chord info
-        self._draw_individual_notes(x_start, y_start + 120, active_notes, notes_info)
-    
+        # Chord detection only depends on the sounding notes, so rerun it
+        # only when they change (a held chord costs one lookup per frame).
+        # A sorted tuple keeps duplicate pitches distinct - two strings on
+        # the same MIDI note must still count as two notes
+        key = tuple(sorted(active_notes.values()))
+        if key != self._last_notes_key:
+            self._last_notes_info = self.chord_detector.get_active_notes_info(active_notes)
+            self._last_notes_key = key
+        return self._last_notes_info
+
     def _draw_chord_display(self, x: int, y: int, notes_info: Dict) -> None:
         """Draw the main chord display section.
         
@@ -271,73 +556,94 @@ class GuitarDisplay:
             notes_info (Dict): Dictionary containing note information and chord analysis
         """
         # Title
-        title = self.font.render("Current Chord:", True, self.WHITE)
+        title = self._render(self.font, "Current Chord:", self.WHITE)
         self.screen.blit(title, (x, y))
         
         # Chord name or status
         if notes_info['note_count'] == 0:
-            status_text = self.small_font.render("(Press keys to play)", True, self.GRAY)
+            status_text = self._render(self.small_font, "(Press keys to play)", self.GRAY)
             self.screen.blit(status_text, (x + 20, y + 35))
         elif notes_info['chord']['name']:
             # Display detected chord prominently
-            chord_text = self.chord_font.render(notes_info['chord']['name'], True, self.ORANGE)
+            chord_text = self._render(self.chord_font, notes_info['chord']['name'], self.ORANGE)
             self.screen.blit(chord_text, (x + 20, y + 35))
             
             # Show root note
-            root_text = self.small_font.render(f"Root: {notes_info['chord']['root']}", True, self.YELLOW)
+            root_text = self._render(self.small_font, f"Root: {notes_info['chord']['root']}", self.YELLOW)
             self.screen.blit(root_text, (x + 20, y + 75))
         else:
             # No chord detected, show note count
             if notes_info['note_count'] == 1:
-                status_text = self.small_font.render("Single Note", True, self.BLUE)
+                status_text = self._render(self.small_font, "Single Note", self.BLUE)
             else:
-                status_text = self.small_font.render(f"{notes_info['note_count']} Notes (No chord)", True, self.BLUE)
+                status_text = self._render(self.small_font, f"{notes_info['note_count']} Notes (No chord)", self.BLUE)
             self.screen.blit(status_text, (x + 20, y + 35))
         
-        # Show active note names
+        # Show active note names, stopping at the display limit instead of
+        # joining the full list and slicing the overflow away
         if notes_info['note_names']:
-            notes_display = " - ".join(notes_info['note_names'])
-            if len(notes_display) > 20:  # Wrap long note lists
-                notes_display = notes_display[:20] + "..."
-            notes_text = self.small_font.render(f"Notes: {notes_display}", True, self.GREEN)
+            parts: List[str] = []
+            total = -3  # First note has no " - " separator
+            for name in notes_info['note_names']:
+                total += len(name) + 3
+                if total > 20:  # Wrap long note lists
+                    parts.append("...")
+                    break
+                parts.append(name)
+            notes_text = self._render(self.small_font, f"Notes: {' - '.join(parts)}", self.GREEN)
             self.screen.blit(notes_text, (x + 20, y + 95))
     
-    def _draw_individual_notes(
-        self, x: int, y: int, active_notes: Dict[Tuple[int, int], int], notes_info: Dict
-    ) -> None:
-        """Draw individual note details.
-        
+    def _build_dropdown_panel(self, instruments: tuple[str, ...], current_instrument: str) -> pygame.Surface:
+        """Compose the dropdown options panel into an off-screen Surface
+
         Args:
-            x (int): X coordinate to start drawing the individual notes
-            y (int): Y coordinate to start drawing the individual notes
-            active_notes (Dict[Tuple[int, int], int]): Dictionary mapping (string, fret) to MIDI note numbers
-            notes_info (Dict): Dictionary containing note information and chord analysis
+            instruments (tuple[str, ...]): Instrument names
+            current_instrument (str): Name of the current instrument
+
+        Returns:
+            pygame.Surface: Options panel ready to blit at the dropdown position
         """
-        if not active_notes:
-            return
-        
-        # Title for individual notes section
-        title = self.small_font.render("Individual Notes:", True, self.WHITE)
-        self.screen.blit(title, (x, y))
-        
-        # List each active note with string and fret info
-        for i, ((string_index, fret), midi_note) in enumerate(active_notes.items()):
-            string_name = self.mapping.get_string_name(string_index)
-            note_name = self.chord_detector.midi_to_note_with_octave(midi_note)
-            
-            # Color code by string
-            string_colors = {0: self.RED, 1: self.BLUE, 2: self.GREEN, 3: self.PURPLE}
-            color = string_colors.get(string_index, self.WHITE)
-            
-            note_text = f"{string_name} F{fret}: {note_name}"
-            text = self.tiny_font.render(note_text, True, color)
-            self.screen.blit(text, (x + 20, y + 25 + i * 18))
-    
-    def draw_instrument_dropdown(self, instruments: list[str], current_instrument: str) -> None:
+        panel = pygame.Surface(self.dropdown_options_rect.size)
+        panel_rect = panel.get_rect()
+        panel.fill(self.WHITE)
+        pygame.draw.rect(panel, self.DARK_GRAY, panel_rect, 2)
+
+        render = self._render
+        tiny = self.tiny_font
+        blit_seq: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        for i in range(self.dropdown_visible_items):
+            instrument_index = i + self.dropdown_scroll_offset
+            if instrument_index >= len(instruments):
+                break
+
+            instrument = instruments[instrument_index]
+            option_y = i * self.dropdown_item_height
+
+            # Ensure option is within the panel
+            if option_y >= panel_rect.bottom:
+                break
+
+            # Highlight current instrument
+            if instrument == current_instrument:
+                pygame.draw.rect(panel, self.BLUE,
+                                 pygame.Rect(0, option_y, panel_rect.width, self.dropdown_item_height))
+                text_color = self.WHITE
+            else:
+                text_color = self.BLACK
+
+            blit_seq.append((render(tiny, instrument, text_color), (5, option_y + 2)))
+
+        if hasattr(panel, 'fblits'):
+            panel.fblits(blit_seq)
+        else:
+            panel.blits(blit_seq, doreturn=False)
+        return panel
+
+    def draw_instrument_dropdown(self, instruments: tuple[str, ...], current_instrument: str) -> None:
         """Draw the instrument selection dropdown.
         
         Args:
-            instruments (list[str]): List of instrument names
+            instruments (tuple[str, ...]): Instrument names
             current_instrument (str): Name of the current instrument
         """
         # Draw dropdown button
@@ -348,100 +654,61 @@ class GuitarDisplay:
         # Draw current instrument text (no truncation needed with wider dropdown)
         current_text = current_instrument
         
-        text = self.tiny_font.render(current_text, True, self.BLACK)
+        text = self._render(self.tiny_font, current_text, self.BLACK)
         text_rect = text.get_rect(center=(self.dropdown_rect.centerx - 10, self.dropdown_rect.centery))
         self.screen.blit(text, text_rect)
         
-        # Draw dropdown arrow
-        arrow_x = self.dropdown_rect.right - 15
-        arrow_y = self.dropdown_rect.centery
-        if self.dropdown_open:
-            # Up arrow
-            points = [(arrow_x, arrow_y + 3), (arrow_x + 5, arrow_y - 3), (arrow_x + 10, arrow_y + 3)]
-        else:
-            # Down arrow
-            points = [(arrow_x, arrow_y - 3), (arrow_x + 5, arrow_y + 3), (arrow_x + 10, arrow_y - 3)]
+        # Draw dropdown arrow (precomputed vertices)
+        points = self._arrow_up_points if self.dropdown_open else self._arrow_down_points
         pygame.draw.polygon(self.screen, self.BLACK, points)
         
         # Draw dropdown options if open
         if self.dropdown_open:
-            # Background
-            pygame.draw.rect(self.screen, self.WHITE, self.dropdown_options_rect)
-            pygame.draw.rect(self.screen, self.DARK_GRAY, self.dropdown_options_rect, 2)
-            
             # Calculate scrolling
             max_scroll = max(0, len(instruments) - self.dropdown_visible_items)
             self.dropdown_scroll_offset = max(0, min(self.dropdown_scroll_offset, max_scroll))
-            
-            # Draw visible options only
-            for i in range(self.dropdown_visible_items):
-                instrument_index = i + self.dropdown_scroll_offset
-                if instrument_index >= len(instruments):
-                    break
-                    
-                instrument = instruments[instrument_index]
-                option_y = self.dropdown_options_rect.y + i * self.dropdown_item_height
-                
-                # Ensure option is within the dropdown rect
-                if option_y >= self.dropdown_options_rect.bottom:
-                    break
-                    
-                option_rect = pygame.Rect(self.dropdown_options_rect.x, option_y, 
-                                        self.dropdown_options_rect.width, self.dropdown_item_height)
-                
-                # Highlight current instrument
-                if instrument == current_instrument:
-                    pygame.draw.rect(self.screen, self.BLUE, option_rect)
-                    text_color = self.WHITE
-                else:
-                    text_color = self.BLACK
-                
-                # Draw text
-                text = self.tiny_font.render(instrument, True, text_color)
-                self.screen.blit(text, (option_rect.x + 5, option_rect.y + 2))
-            
-            # Draw scroll indicators if needed
+
+            # The composed options panel only depends on the visible slice
+            # of the list and the highlighted entry, so it is cached and
+            # rebuilt only when scrolling or the selection changes
+            panel_key = (self.dropdown_scroll_offset, current_instrument, tuple(instruments))
+            if panel_key != self._dropdown_panel_key:
+                self._dropdown_panel = self._build_dropdown_panel(instruments, current_instrument)
+                self._dropdown_panel_key = panel_key
+            self.screen.blit(self._dropdown_panel, self.dropdown_options_rect.topleft)
+
+            # Draw scroll indicators if needed (precomputed vertices)
             if len(instruments) > self.dropdown_visible_items:
-                # Scroll up indicator
                 if self.dropdown_scroll_offset > 0:
-                    up_rect = pygame.Rect(self.dropdown_options_rect.right - 15, 
-                                        self.dropdown_options_rect.y + 2, 10, 8)
-                    pygame.draw.polygon(self.screen, self.DARK_GRAY, 
-                                        [(up_rect.centerx, up_rect.y), 
-                                        (up_rect.left, up_rect.bottom),
-                                        (up_rect.right, up_rect.bottom)])
-                
-                # Scroll down indicator
+                    pygame.draw.polygon(self.screen, self.DARK_GRAY, self._scroll_up_points)
                 if self.dropdown_scroll_offset < max_scroll:
-                    down_rect = pygame.Rect(self.dropdown_options_rect.right - 15, 
-                                            self.dropdown_options_rect.bottom - 10, 10, 8)
-                    pygame.draw.polygon(self.screen, self.DARK_GRAY,
-                                        [(down_rect.centerx, down_rect.bottom),
-                                        (down_rect.left, down_rect.y),
-                                        (down_rect.right, down_rect.y)])
+                    pygame.draw.polygon(self.screen, self.DARK_GRAY, self._scroll_down_points)
     
-    def handle_dropdown_click(self, pos: tuple[int, int], instruments: list[str]) -> Optional[str]:
+    def handle_dropdown_click(self, pos: tuple[int, int], instruments: tuple[str, ...]) -> Optional[str]:
         """Handle mouse clicks on the dropdown. Returns selected instrument or None.
         
         Args:
             pos (tuple[int, int]): Mouse click position (x, y)
-            instruments (list[str]): List of instrument names
+            instruments (tuple[str, ...]): Instrument names
         
         """
         mouse_x, mouse_y = pos
-        
-        # Click on help button
-        if self.help_button_rect.collidepoint(mouse_x, mouse_y):
+
+        # Click on help button (inline bounds check - no collidepoint call)
+        left, top, right, bottom = self._hb_bounds
+        if left <= mouse_x < right and top <= mouse_y < bottom:
             self.help_visible = not self.help_visible
             return None
-        
+
         # Click on dropdown button
-        if self.dropdown_rect.collidepoint(mouse_x, mouse_y):
+        left, top, right, bottom = self._dd_bounds
+        if left <= mouse_x < right and top <= mouse_y < bottom:
             self.dropdown_open = not self.dropdown_open
             return None
-        
+
         # Click on dropdown options (if open)
-        if self.dropdown_open and self.dropdown_options_rect.collidepoint(mouse_x, mouse_y):
+        left, top, right, bottom = self._ddo_bounds
+        if self.dropdown_open and left <= mouse_x < right and top <= mouse_y < bottom:
             relative_y = mouse_y - self.dropdown_options_rect.y
             clicked_index = relative_y // self.dropdown_item_height
             
@@ -456,8 +723,10 @@ class GuitarDisplay:
         if self.dropdown_open:
             self.dropdown_open = False
         
-        # Click outside help overlay - close help
-        if self.help_visible and not (150 <= mouse_x <= 750 and 200 <= mouse_y <= 500):
+        # Click outside help overlay - close help (bounds shared with
+        # draw_help_overlay, so the hit area always matches the drawing)
+        left, top, right, bottom = self._help_bounds
+        if self.help_visible and not (left <= mouse_x < right and top <= mouse_y < bottom):
             self.help_visible = False
         
         return None
@@ -473,7 +742,7 @@ class GuitarDisplay:
         pygame.draw.rect(self.screen, down_color, self.octave_down_rect)
         pygame.draw.rect(self.screen, self.WHITE, self.octave_down_rect, 2)
         
-        down_text = self.small_font.render("-OCT", True, self.WHITE)
+        down_text = self._render(self.small_font, "-OCT", self.WHITE)
         down_text_rect = down_text.get_rect(center=self.octave_down_rect.center)
         self.screen.blit(down_text, down_text_rect)
         
@@ -482,13 +751,13 @@ class GuitarDisplay:
         pygame.draw.rect(self.screen, up_color, self.octave_up_rect)
         pygame.draw.rect(self.screen, self.WHITE, self.octave_up_rect, 2)
         
-        up_text = self.small_font.render("+OCT", True, self.WHITE)
+        up_text = self._render(self.small_font, "+OCT", self.WHITE)
         up_text_rect = up_text.get_rect(center=self.octave_up_rect.center)
         self.screen.blit(up_text, up_text_rect)
         
         # Current octave display
         octave_display = f"Octave: {current_octave:+d}" if current_octave != 0 else "Octave: 0"
-        octave_text = self.small_font.render(octave_display, True, self.YELLOW)
+        octave_text = self._render(self.small_font, octave_display, self.YELLOW)
         self.screen.blit(octave_text, (300, 30))
     
     def handle_octave_buttons(self, pos: tuple[int, int]) -> bool:
@@ -611,7 +880,7 @@ class GuitarDisplay:
                 pygame.draw.rect(self.screen, self.LIGHT_GRAY, option_rect)
             
             # Draw text
-            text = self.small_font.render(f"{note_name} ({midi_note})", True, self.BLACK)
+            text = self._render(self.small_font, f"{note_name} ({midi_note})", self.BLACK)
             text_rect = text.get_rect(center=option_rect.center)
             self.screen.blit(text, text_rect)
     
@@ -654,7 +923,7 @@ class GuitarDisplay:
                 text_color = self.BLACK
             
             # Draw text
-            text = self.small_font.render(f"{note_name}", True, text_color)
+            text = self._render(self.small_font, f"{note_name}", text_color)
             text_rect = text.get_rect(center=option_rect.center)
             self.screen.blit(text, text_rect)
     
@@ -670,14 +939,14 @@ class GuitarDisplay:
         pygame.draw.rect(self.screen, self.WHITE, self.sustain_button_rect, 2)
         
         sustain_text = "SUSTAIN" if sustain_mode else "SUSTAIN"
-        text = self.small_font.render(sustain_text, True, self.WHITE)
+        text = self._render(self.small_font, sustain_text, self.WHITE)
         text_rect = text.get_rect(center=self.sustain_button_rect.center)
         self.screen.blit(text, text_rect)
         
         # Status indicator
         status_text = "ON" if sustain_mode else "OFF"
         status_color = self.GREEN if sustain_mode else self.RED
-        status = self.tiny_font.render(status_text, True, status_color)
+        status = self._render(self.tiny_font, status_text, status_color)
         self.screen.blit(status, (self.sustain_button_rect.x + 5, self.sustain_button_rect.bottom + 5))
     
     def handle_sustain_button(self, pos: tuple[int, int]) -> bool:
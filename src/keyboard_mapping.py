@@ -10,7 +10,14 @@ class KeyboardMapping:
     Each keyboard column represents one fret across all strings.
     Layout: G(1234567890), D(QWERTYUIOP), A(ASDFGHJKL;), E(ZXCVBNM,./)
     """
-    
+
+    # Fixed attribute layout - slot offsets are cheaper than dict-based
+    # attribute access on the per-key-event lookup path
+    __slots__ = (
+        'string_names', 'string_base_notes', 'string_tuning_options',
+        'keyboard_columns', 'scancode_mapping', '_scancode_lut', '_midi_table',
+    )
+
     def __init__(self) -> None:
         """Initialize keyboard mapping with guitar tuning and layout"""
         # Standard guitar tuning (4 strings, low to high pitch)
@@ -42,24 +49,73 @@ class KeyboardMapping:
         # Pre-computed mapping for fast lookup
         self.scancode_mapping: Dict[int, Tuple[int, int]] = {}
         self._generate_mapping()
+
+        # Pre-computed MIDI notes for every (string, fret, octave) combination
+        self._rebuild_midi_table()
+
+    def _rebuild_midi_table(self) -> None:
+        """Precompute MIDI notes for every string/fret/octave combination
+
+        The table only depends on string_base_notes, so it is rebuilt on
+        tuning changes and get_midi_note becomes a pure indexed lookup
+        instead of per-call arithmetic.
+        """
+        num_frets = len(self.keyboard_columns)
+        self._midi_table: List[List[List[int]]] = [
+            [[base + fret + octave * 12 for octave in range(-3, 4)] for fret in range(num_frets)]
+            for base in self.string_base_notes
+        ]
     
     def _generate_mapping(self) -> None:
         """Generate scancode to (string_index, fret) mapping for fast lookup"""
         for fret, column in enumerate(self.keyboard_columns):
             for string_index, scancode in enumerate(column):
                 self.scancode_mapping[scancode] = (string_index, fret)
-    
+
+        # Scancodes are small dense integers, so a flat list indexed by
+        # scancode beats a dict lookup (no hashing) on the per-key-event path
+        self._scancode_lut: List[Optional[Tuple[int, int]]] = [None] * (max(self.scancode_mapping) + 1)
+        for scancode, position in self.scancode_mapping.items():
+            self._scancode_lut[scancode] = position
+
     def get_guitar_position(self, scancode: int) -> Optional[Tuple[int, int]]:
         """Get guitar position for a keyboard scancode
-        
+
         Args:
             scancode (int): Pygame keyboard scancode
-            
+
         Returns:
             Optional[Tuple[int, int]]: (string_index, fret) tuple if mapped, None otherwise
         """
-        return self.scancode_mapping.get(scancode)
+        return self._scancode_lut[scancode] if scancode < len(self._scancode_lut) else None
     
+    def dispatch_batch(self, scancodes: List[int], octave_offset: int = 0) -> List[Tuple[int, int, int]]:
+        """Resolve a batch of scancodes to (string, fret, midi_note) in one pass
+
+        Useful when several keys arrive in the same frame (chord presses):
+        the lookup tables are bound once and unmapped scancodes are
+        skipped, instead of paying the per-call overhead of
+        get_guitar_position + get_midi_note for each key.
+
+        Args:
+            scancodes (List[int]): Pygame keyboard scancodes
+            octave_offset (int): Octave offset (-3 to +3, defaults to 0)
+
+        Returns:
+            List[Tuple[int, int, int]]: (string_index, fret, midi_note) per mapped scancode
+        """
+        lut = self._scancode_lut
+        lut_len = len(lut)
+        octave_column = octave_offset + 3
+        midi_table = self._midi_table
+        out: List[Tuple[int, int, int]] = []
+        for scancode in scancodes:
+            position = lut[scancode] if scancode < lut_len else None
+            if position is not None:
+                string_index, fret = position
+                out.append((string_index, fret, midi_table[string_index][fret][octave_column]))
+        return out
+
     def get_midi_note(self, string_index: int, fret: int, octave_offset: int = 0) -> int:
         """Calculate MIDI note number for given string and fret
         
@@ -71,9 +127,7 @@ class KeyboardMapping:
         Returns:
             int: MIDI note number (open string + fret offset + octave offset)
         """
-        base_note = self.string_base_notes[string_index] + fret
-        # Each octave is 12 semitones in MIDI
-        return base_note + (octave_offset * 12)
+        return self._midi_table[string_index][fret][octave_offset + 3]
     
     def get_string_name(self, string_index: int) -> str:
         """Get display name for a guitar string
@@ -97,6 +151,7 @@ class KeyboardMapping:
         if 0 <= string_index < len(self.string_base_notes):
             self.string_base_notes[string_index] = midi_note
             self.string_names[string_index] = note_name
+            self._rebuild_midi_table()
     
     def get_tuning_options_for_string(self, string_index: int) -> List[Tuple[str, int]]:
         """Get available tuning options for a specific string
@@ -134,24 +189,20 @@ class KeyboardMapping:
             return True
         return False
     
+    # Preset name keyed by the open-string MIDI notes - the notes identify
+    # a tuning on their own, so no per-call list building or name matching
+    _PRESET_BY_NOTES: Dict[Tuple[int, int, int, int], str] = {
+        (55, 50, 45, 40): "Standard",
+        (55, 50, 45, 38): "Drop D",
+        (53, 48, 43, 36): "Drop C",
+        (52, 47, 42, 35): "Drop B",
+        (55, 50, 43, 38): "Open G",
+    }
+
     def get_current_tuning_name(self) -> str:
         """Get a descriptive name for the current tuning
-        
+
         Returns:
             str: Name of the current tuning or "Custom" if no preset matches
         """
-        current = [(name, note) for name, note in zip(self.string_names, self.string_base_notes)]
-        
-        # Check against known presets
-        if current == [("G", 55), ("D", 50), ("A", 45), ("E", 40)]:
-            return "Standard"
-        elif current == [("G", 55), ("D", 50), ("A", 45), ("D", 38)]:
-            return "Drop D"
-        elif current == [("F", 53), ("C", 48), ("G", 43), ("C", 36)]:
-            return "Drop C"
-        elif current == [("E", 52), ("B", 47), ("F#/Gb", 42), ("B", 35)]:
-            return "Drop B"
-        elif current == [("G", 55), ("D", 50), ("G", 43), ("D", 38)]:
-            return "Open G"
-        else:
-            return "Custom"
\ No newline at end of file
+        return self._PRESET_BY_NOTES.get(tuple(self.string_base_notes), "Custom")
\ No newline at end of file
@@ -1,8 +1,39 @@
 """MIDI Controller with FluidSynth synthesis"""
 
+import array
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+
 import fluidsynth
 import pygame.midi
-from typing import Optional, Dict, Tuple, List
+from typing import Callable, Optional, Dict, Tuple, List
+
+# Equal-temperament frequency for every MIDI note (A4 = 440 Hz), computed
+# once at import so the per-note path never calls pow
+_MIDI_FREQ: Tuple[float, ...] = tuple(440.0 * (2.0 ** ((n - 69) / 12.0)) for n in range(128))
+
+
+# Instrument data travels as one immutable record: a reload builds a
+# fresh table off to the side and publishes it with a single attribute
+# bind (atomic under the GIL), so the note worker can read it lock-free
+_InstrumentTable = namedtuple('_InstrumentTable', ('names', 'programs', 'name_to_idx'))
+_EMPTY_TABLE = _InstrumentTable((), b'', {})
+
+# How far ahead (ms) pre-scheduled events are stamped - enough slack for
+# the scheduling call itself, small enough to be inaudible
+_LATENCY_MS: int = 10
+
+
+def _noop2(_a: int, _b: int) -> None:
+    """Stand-in for a 2-argument backend call when the backend is absent"""
+
+
+def _noop3(_a: int, _b: int, _c: int) -> None:
+    """Stand-in for a 3-argument backend call when the backend is absent"""
 
 
 class MidiController:
@@ -12,101 +43,259 @@ class MidiController:
     Uses General MIDI program numbers for instrument selection.
     """
     
-    def __init__(self) -> None:
-        """Initialize MIDI controller with FluidSynth and instrument mappings"""
+    def __init__(self, audio_period_size: int = 128, audio_periods: int = 4) -> None:
+        """Initialize MIDI controller with FluidSynth and instrument mappings
+
+        Args:
+            audio_period_size (int): FluidSynth audio period size in frames
+                (128x4 is ~5ms at 48kHz; embedded targets may want larger)
+            audio_periods (int): Number of FluidSynth audio periods
+        """
+        self.audio_period_size: int = audio_period_size
+        self.audio_periods: int = audio_periods
         self.midi_out: Optional[pygame.midi.Output] = None
-        self.active_notes: Dict[Tuple[int, int], int] = {}  # {(string, fret): midi_note}
+        # Sounding notes in a flat 40-byte table indexed string*10+fret;
+        # a slot holds midi_note+1 so 0 means "inactive". No tuple build,
+        # hash, or dict churn per note - just an indexed byte store
+        self._active: bytearray = bytearray(40)
         
-        # Dynamic instrument mappings (loaded from SoundFont)
-        self.instruments: Dict[str, int] = {}
-        self.current_instrument: str = ""
+        # Instrument table in SoA layout (loaded from SoundFont): names and
+        # program numbers are parallel arrays indexed by a small int, and
+        # the name->index dict is only consulted when resolving a name -
+        # the hot paths (UI cycling, current-instrument reads) stay indexed.
+        # The whole record is swapped atomically on (re)load
+        self._table: _InstrumentTable = _EMPTY_TABLE
+        self._current_idx: int = -1
+        self._last_program: int = -1  # last program number actually sent
+        self._instruments_loaded: bool = False
         
         # FluidSynth components
         self.fs: Optional[fluidsynth.Synth] = None
         self.soundfont_id: Optional[int] = None
         self.soundfont_path: str = "data/soundfont.sf2"
+        # Sequencer for timed notes (set up by the loader thread)
+        self._seq: Optional[fluidsynth.Sequencer] = None
+        self._synth_id: int = -1
         
-        self._initialize_fluidsynth()
-    
+        # Backend health flags: flipped off (with one log line) on the
+        # first failure, so a device that dies mid-play degrades to a
+        # single boolean test per note instead of a raising FFI call plus
+        # exception construction every time. _fs_ok starts False and the
+        # loader thread flips it on once the synth is live
+        self._fs_ok: bool = False
+        self._midi_ok: bool = False  # set once a MIDI output is opened
+
+        # Bound methods hoisted onto the instance: the note paths skip the
+        # fs/midi_out attribute walk and method resolution on every call,
+        # and the noop fallbacks keep the bindings valid before a backend
+        # exists
+        self._fs_noteon: Callable[..., object] = _noop3
+        self._fs_noteoff: Callable[..., object] = _noop2
+        self._midi_write_short: Callable[..., object] = _noop3
+
+        # SoundFont loading is disk I/O plus an SF2 parse, so it runs on
+        # a background thread instead of blocking UI boot; _ready is set
+        # once the synth is live (or has failed over to no-synth mode)
+        self._ready = threading.Event()
+        threading.Thread(target=self._initialize_fluidsynth, daemon=True).start()
+
+        # Precomputed MIDI status bytes (channel 0 nibble OR'd in) for the
+        # raw write_short path - note_on/note_off/set_instrument are
+        # Python wrappers that build a message list before hitting C
+        self._status_noteon: int = 0x90
+        self._status_noteoff: int = 0x80
+        self._status_program: int = 0xC0
+
+        # Note events are handed to a worker thread so the caller (the
+        # input/UI thread) only pays an enqueue - the synth/MIDI FFI calls
+        # happen off-thread
+        self._event_q: "queue.SimpleQueue" = queue.SimpleQueue()
+
+        # Reusable rows for batched MIDI writes ([[status, d1, d2], ts]
+        # per PortMidi message) - mutated in place by the worker and grown
+        # on demand but never shrunk, so steady-state chords only allocate
+        # the short slice handed to write()
+        self._msg_scratch: List[list] = [[[0, 0, 0], 0] for _ in range(8)]
+
+        self._note_worker = threading.Thread(target=self._event_worker, daemon=True)
+        self._note_worker.start()
+
+        # Per-note diagnostics go through a bounded ring (deque append is
+        # atomic under the GIL) drained to stdout at ~30 Hz by a daemon
+        # thread, so neither the input thread nor the note worker ever
+        # blocks on the stdio lock or a write syscall
+        self._log_ring: deque = deque(maxlen=32)
+        self._log_worker = threading.Thread(target=self._drain_logs, daemon=True)
+        self._log_worker.start()
+
+    def _drain_logs(self) -> None:
+        """Flush queued diagnostic lines to stdout at roughly 30 Hz
+
+        Runs as a daemon thread; the ring's maxlen bounds both memory and
+        the amount of output written per wakeup, dropping the oldest
+        lines under sustained bursts.
+        """
+        ring = self._log_ring
+        write = sys.stdout.write
+        while True:
+            time.sleep(1 / 30)
+            while ring:
+                write(ring.popleft() + "\n")
+
+    def _event_worker(self) -> None:
+        """Drain note events and perform the synth/MIDI calls off-thread
+
+        Runs as a daemon thread; a None sentinel (pushed by cleanup) makes
+        it drain the queue and exit.
+        """
+        # Hold queued events until the synth is live - keys pressed while
+        # the SoundFont loads are buffered, not dropped
+        self._ready.wait()
+        while True:
+            event = self._event_q.get()
+            if event is None:
+                break
+            if event[0] == 'on':
+                self._do_note_on(*event[1:])
+            elif event[0] == 'off':
+                self._do_note_off(event[1])
+            elif event[0] == 'chord':
+                self._do_chord_on(event[1])
+            else:  # 'alloff'
+                self._do_all_notes_off(event[1])
+
     def _initialize_fluidsynth(self) -> None:
         """Initialize FluidSynth synthesizer with SoundFont"""
         try:
             self.fs = fluidsynth.Synth()
+            # Size the audio buffers explicitly (instead of the driver
+            # default) and let FluidSynth render voices on all cores -
+            # must happen before start()
+            self.fs.setting('audio.period-size', self.audio_period_size)
+            self.fs.setting('audio.periods', self.audio_periods)
+            self.fs.setting('synth.cpu-cores', os.cpu_count() or 1)
             self.fs.start()
+
+            # Sequencer driven by the synth's sample clock (not the OS
+            # timer), so scheduled note-offs fire sample-accurately even
+            # when the Python side is busy
+            try:
+                self._seq = fluidsynth.Sequencer(time_scale=1000, use_system_timer=False)
+                self._synth_id = self._seq.register_fluidsynth(self.fs)
+            except Exception:
+                self._seq = None  # old bindings without sequencer support
+
             self.soundfont_id = self.fs.sfload(self.soundfont_path)
             
             if self.soundfont_id != -1:
-                # Load all available instruments from the SoundFont
-                self._load_instruments_from_soundfont()
-                
-                # Select first available instrument as default
-                if self.instruments:
-                    first_instrument = list(self.instruments.keys())[0]
-                    self.current_instrument = first_instrument
-                    self.fs.program_select(0, self.soundfont_id, 0, self.instruments[first_instrument])
-                
+                # Instrument enumeration is deferred to _ensure_instruments:
+                # the preset scan only runs once something needs the table
                 print(f"✅ FluidSynth initialized with {self.soundfont_path}")
-                print(f"🎵 Loaded {len(self.instruments)} instruments")
             else:
                 print(f"❌ Failed to load SoundFont: {self.soundfont_path}")
         except Exception as e:
             print(f"❌ FluidSynth initialization failed: {e}")
             self.fs = None
-    
-    
+
+        if self.fs is not None:
+            self._fs_noteon = self.fs.noteon
+            self._fs_noteoff = self.fs.noteoff
+            self._fs_ok = True
+        # Live or failed over, the controller is now usable
+        self._ready.set()
+
+    def _ensure_instruments(self) -> None:
+        """Build the instrument table on first use
+
+        The 128-slot preset scan costs an FFI name fetch per program, and
+        the names are only needed once the instrument menu (or a name
+        lookup) asks for them - so the scan runs lazily, exactly once.
+        """
+        if self._instruments_loaded:
+            return
+        self._instruments_loaded = True
+
+        # The SoundFont may still be loading in the background - the rest
+        # of startup has already overlapped with it by this point
+        self._ready.wait()
+
+        if self.fs is None or self.soundfont_id in (None, -1):
+            return
+
+        self._load_instruments_from_soundfont()
+
+        # Select first available instrument as default
+        table = self._table
+        if table.names:
+            self._current_idx = 0
+            self._last_program = table.programs[0]
+            self.fs.program_select(0, self.soundfont_id, 0, self._last_program)
+            # initialize() may have opened the external device before the
+            # lazy table existed (its _current_idx sync saw -1), so send
+            # the default Program Change here as well
+            if self._midi_ok:
+                self._midi_write_short(self._status_program, self._last_program, 0)
+        print(f"🎵 Loaded {len(table.names)} instruments")
+
     def _load_instruments_from_soundfont(self) -> None:
         """Dynamically load all available instruments from the loaded SoundFont"""
-        # Get all presets from the loaded SoundFont
+        # Walk the SoundFont's preset table directly: sfpreset_name returns
+        # None for empty slots, so existing presets are found without
+        # selecting each program (which mutates channel state and raises
+        # for every missing one - 128 exception unwinds at startup)
         # FluidSynth uses bank/program structure, we'll scan bank 0 (standard melodic instruments)
         bank = 0
-        
+        names: List[str] = []
+        programs = array.array('B')
+        name_to_idx: Dict[str, int] = {}
+
+        def add(name: str, program: int) -> None:
+            # Keep the first occurrence when a SoundFont reuses a preset name
+            if name not in name_to_idx:
+                name_to_idx[name] = len(names)
+                names.append(name)
+                programs.append(program)
+
         for program in range(128):  # MIDI programs 0-127
-            # Try to select this program to see if it exists
-            result = self.fs.program_select(0, self.soundfont_id, bank, program)
-            
-            if result == 0:  # Success (FluidSynth returns 0 on success)
-                # Try to get the preset name from FluidSynth
-                preset_name = self._get_preset_name(bank, program)
-                
+            try:
+                preset_name = self.fs.sfpreset_name(self.soundfont_id, bank, program)
+            except Exception:
+                preset_name = None
+
+            if preset_name is not None:
+                preset_name = preset_name.strip()
                 if preset_name:
-                    self.instruments[preset_name] = program
+                    add(preset_name, program)
                 else:
                     # Simple fallback - just program number
-                    self.instruments[f"Program {program:03d}"] = program
-    
-    def _get_preset_name(self, bank: int, program: int) -> Optional[str]:
-        """Try to get the actual preset name from FluidSynth
-        
-        Args:
-            bank (int): MIDI bank number
-            program (int): MIDI program number
-            
-        Returns:
-            Optional[str]: Preset name if available
-        """
-        try:
-            # Use FluidSynth's sfpreset_name method to get the preset name
-            if self.fs and self.soundfont_id is not None:
-                preset_name = self.fs.sfpreset_name(self.soundfont_id, bank, program)
-                if preset_name and preset_name.strip():
-                    return preset_name.strip()
-            
-            # Fallback: return None so we use simple program numbers
-            return None
-            
-        except Exception:
-            return None
-    
-    
+                    add(f"Program {program:03d}", program)
+
+        # Old FluidSynth bindings without preset introspection: fall back
+        # to probing via program_select like before
+        if not names:
+            for program in range(128):
+                if self.fs.program_select(0, self.soundfont_id, bank, program) == 0:
+                    add(f"Program {program:03d}", program)
+
+        # Publish the finished table in one attribute bind - readers on
+        # other threads see either the old record or the new one, whole
+        self._table = _InstrumentTable(tuple(names), bytes(programs), name_to_idx)
+
+
     def initialize(self) -> bool:
         """Initialize pygame MIDI output device
         
         Returns:
             True if MIDI device was successfully initialized
         """
-        pygame.midi.init()
+        # Idempotent - pygame.midi.init() only needs to run once per process
+        if not pygame.midi.get_init():
+            pygame.midi.init()
         device_id: int = pygame.midi.get_default_output_id()
-        
+        # Each get_device_info call crosses into PortMidi and builds a
+        # tuple, so fetch the winner's info exactly once and reuse it
+        chosen_info = pygame.midi.get_device_info(device_id) if device_id != -1 else None
+
         # Find first available output device if default not available
         if device_id == -1:
             device_count: int = pygame.midi.get_count()
@@ -114,47 +303,166 @@ class MidiController:
                 device_info = pygame.midi.get_device_info(i)
                 if device_info[3]:  # is_output flag
                     device_id = i
+                    chosen_info = device_info
                     break
-        
+
         if device_id != -1:
-            self.midi_out = pygame.midi.Output(device_id)
-            device_name: str = pygame.midi.get_device_info(device_id)[1].decode()
+            # Explicit buffer size - PortMidi's default 256-event buffer
+            # can overflow under fast strumming or a panic stop. Nonzero
+            # latency makes PortMidi honor message timestamps, which the
+            # pre-scheduled note-off path relies on
+            self.midi_out = pygame.midi.Output(
+                device_id, latency=_LATENCY_MS, buffer_size=1024)
+            self._midi_ok = True
+            self._midi_write_short = self.midi_out.write_short
+            device_name: str = chosen_info[1].decode()
             print(f"✅ MIDI connected: {device_name}")
-            self.set_instrument(self.current_instrument)
+            # Bring the fresh device in line with the current instrument
+            # (set_instrument_by_index would early-return as a no-op)
+            if self._current_idx >= 0:
+                self._midi_write_short(
+                    self._status_program, self._table.programs[self._current_idx], 0)
             return True
         
         return False
     
-    def play_note(self, string_index: int, fret: int, midi_note: int, string_name: str = "") -> None:
+    def play_note(self, string_index: int, fret: int, midi_note: int, string_name: str = "",
+                  duration_ms: Optional[int] = None) -> None:
         """Play a note through both FluidSynth and external MIDI
-        
+
         Args:
             string_index (int): Guitar string index (0-3)
             fret (int): Fret position (0-9)
             midi_note (int): MIDI note number to play
             string_name (str): Display name for the string (G, D, A, E)
+            duration_ms (Optional[int]): If given, the note-off is
+                pre-scheduled on the backend clocks and the note ends by
+                itself - no stop_note call needed (or expected)
         """
-        # FluidSynth for immediate, high-quality audio
-        if self.fs:
+        # Extreme tuning + octave shifts can push a note outside MIDI
+        # range; dropping it here keeps the byte table consistent (the
+        # +1 sentinel would alias -1 to "inactive") and keeps a bad
+        # argument from tripping the backend health flags
+        if not 0 <= midi_note <= 127:
+            return
+
+        # Bookkeeping stays on the caller; the synth/MIDI calls and the
+        # console print run on the worker thread. Timed notes end on
+        # their own, so they never enter the active table
+        if duration_ms is None:
+            self._active[string_index * 10 + fret] = midi_note + 1
+        self._event_q.put(('on', string_index, fret, midi_note, string_name, duration_ms))
+
+    def _do_note_on(self, string_index: int, fret: int, midi_note: int, string_name: str,
+                    duration_ms: Optional[int] = None) -> None:
+        """Worker-side note-on: FluidSynth + external MIDI + console print
+
+        Args:
+            string_index (int): Guitar string index (0-3)
+            fret (int): Fret position (0-9)
+            midi_note (int): MIDI note number to play
+            string_name (str): Display name for the string (G, D, A, E)
+            duration_ms (Optional[int]): Pre-scheduled note length, if any
+        """
+        if duration_ms is not None:
+            # Timed path: stamp note-on slightly ahead and note-off at
+            # start+duration, so the audio backends end the note on time
+            # even if Python stalls (GC, UI repaint) in between
+            if self._seq is not None:
+                try:
+                    self._seq.note(time=self._seq.get_tick() + _LATENCY_MS, channel=0,
+                                   key=midi_note, velocity=100, duration=duration_ms,
+                                   dest=self._synth_id)
+                except Exception as e:
+                    self._log_ring.append(f"⚠️ Sequencer schedule failed: {e}")
+            if self._midi_ok:
+                try:
+                    timestamp = pygame.midi.time() + _LATENCY_MS
+                    self.midi_out.write(
+                        [[[self._status_noteon, midi_note, 100], timestamp],
+                         [[self._status_noteoff, midi_note, 0], timestamp + duration_ms]])
+                except Exception as e:
+                    self._midi_ok = False
+                    self._log_ring.append(f"⚠️ MIDI output disabled after failure: {e}")
+        else:
+            # FluidSynth for immediate, high-quality audio
+            if self._fs_ok:
+                try:
+                    self._fs_noteon(0, midi_note, 100)  # Channel 0, velocity 100
+                except Exception as e:
+                    self._fs_ok = False
+                    self._log_ring.append(f"⚠️ FluidSynth disabled after failure: {e}")
+
+            # External MIDI device for hardware synths/DAWs
+            if self._midi_ok:
+                try:
+                    self._midi_write_short(self._status_noteon, midi_note, 100)
+                except Exception as e:
+                    self._midi_ok = False
+                    self._log_ring.append(f"⚠️ MIDI output disabled after failure: {e}")
+
+        # Display note information
+        frequency: float = _MIDI_FREQ[midi_note]
+        display_name: str = string_name or f"S{string_index}"
+        self._log_ring.append(f"🎵 {display_name} F{fret} = MIDI {midi_note} ({frequency:.1f}Hz)")
+
+    def play_chord(self, events: List[Tuple[int, int, int, int]]) -> None:
+        """Play several notes at once with a single batched MIDI write
+
+        Args:
+            events (List[Tuple[int, int, int, int]]): (string_index, fret,
+                midi_note, velocity) per note
+        """
+        # Same range guard as play_note - out-of-range notes are dropped
+        events = [e for e in events if 0 <= e[2] <= 127]
+        if not events:
+            return
+
+        active = self._active
+        for string_index, fret, midi_note, _velocity in events:
+            active[string_index * 10 + fret] = midi_note + 1
+        self._event_q.put(('chord', tuple(events)))
+
+    def _do_chord_on(self, events: Tuple[Tuple[int, int, int, int], ...]) -> None:
+        """Worker-side chord note-ons: one MIDI write for the whole batch
+
+        Args:
+            events (Tuple[Tuple[int, int, int, int], ...]): (string_index,
+                fret, midi_note, velocity) per note
+        """
+        if self._fs_ok:
             try:
-                self.fs.noteon(0, midi_note, 100)  # Channel 0, velocity 100
+                fs_noteon = self._fs_noteon
+                for _string_index, _fret, midi_note, velocity in events:
+                    fs_noteon(0, midi_note, velocity)
             except Exception as e:
-                print(f"⚠️ FluidSynth play failed: {e}")
-        
-        # External MIDI device for hardware synths/DAWs
-        if self.midi_out:
+                self._fs_ok = False
+                self._log_ring.append(f"⚠️ FluidSynth disabled after failure: {e}")
+
+        # One write call submits every note-on to PortMidi together, with
+        # the preallocated rows rewritten in place instead of fresh lists
+        if self._midi_ok:
             try:
-                self.midi_out.note_on(midi_note, 100)
+                scratch = self._msg_scratch
+                while len(scratch) < len(events):
+                    scratch.append([[0, 0, 0], 0])
+                status_noteon = self._status_noteon
+                timestamp = pygame.midi.time()
+                for i, (_string_index, _fret, midi_note, velocity) in enumerate(events):
+                    row = scratch[i]
+                    data = row[0]
+                    data[0] = status_noteon
+                    data[1] = midi_note
+                    data[2] = velocity
+                    row[1] = timestamp
+                self.midi_out.write(scratch[:len(events)])
             except Exception as e:
-                print(f"⚠️ MIDI play failed: {e}")
-        
-        # Display note information
-        frequency: float = 440.0 * (2.0 ** ((midi_note - 69) / 12.0))
-        display_name: str = string_name or f"S{string_index}"
-        print(f"🎵 {display_name} F{fret} = MIDI {midi_note} ({frequency:.1f}Hz)")
-        
-        self.active_notes[(string_index, fret)] = midi_note
-    
+                self._midi_ok = False
+                self._log_ring.append(f"⚠️ MIDI output disabled after failure: {e}")
+
+        self._log_ring.append(f"🎸 Chord: {len(events)} notes " +
+                              " ".join(f"MIDI {midi_note}" for _s, _f, midi_note, _v in events))
+
     def stop_note(self, string_index: int, fret: int) -> None:
         """Stop a note on both FluidSynth and external MIDI
         
@@ -162,28 +470,85 @@ class MidiController:
             string_index (int): Guitar string index
             fret (int): Fret position
         """
-        if (string_index, fret) not in self.active_notes:
+        slot = string_index * 10 + fret
+        value = self._active[slot]
+        if value == 0:
             return
-        
-        midi_note: int = self.active_notes.pop((string_index, fret))
-        
-        # Stop note on both audio systems
-        if self.fs:
+
+        self._active[slot] = 0
+        self._event_q.put(('off', value - 1))
+
+    def _do_note_off(self, midi_note: int) -> None:
+        """Worker-side note-off on both audio systems
+
+        Args:
+            midi_note (int): MIDI note number to stop
+        """
+        if self._fs_ok:
             try:
-                self.fs.noteoff(0, midi_note)
+                self._fs_noteoff(0, midi_note)
             except Exception as e:
-                print(f"⚠️ FluidSynth stop failed: {e}")
-        
-        if self.midi_out:
+                self._fs_ok = False
+                self._log_ring.append(f"⚠️ FluidSynth disabled after failure: {e}")
+
+        if self._midi_ok:
             try:
-                self.midi_out.note_off(midi_note, 0)
+                self._midi_write_short(self._status_noteoff, midi_note, 0)
             except Exception as e:
-                print(f"⚠️ MIDI stop failed: {e}")
+                self._midi_ok = False
+                self._log_ring.append(f"⚠️ MIDI output disabled after failure: {e}")
     
     def stop_all_notes(self) -> None:
         """Stop all currently active notes"""
-        for key in list(self.active_notes.keys()):
-            self.stop_note(key[0], key[1])
+        # Snapshot and clear on the caller; the worker sends the note-offs
+        active = self._active
+        notes = tuple(value - 1 for value in active if value)
+        if not notes:
+            return
+
+        active[:] = bytes(40)
+        self._event_q.put(('alloff', notes))
+
+    def _do_all_notes_off(self, notes: Tuple[int, ...]) -> None:
+        """Worker-side stop of a batch of sounding notes
+
+        Args:
+            notes (Tuple[int, ...]): MIDI note numbers to stop
+        """
+        if len(notes) > 8:
+            # Panic fast path: one All Notes Off message per backend
+            # instead of a note-off per held note
+            if self._fs_ok:
+                try:
+                    self.fs.all_notes_off(0)
+                except Exception as e:
+                    self._fs_ok = False
+                    self._log_ring.append(f"⚠️ FluidSynth disabled after failure: {e}")
+            if self._midi_ok:
+                try:
+                    self._midi_write_short(0xB0, 123, 0)  # CC 123 All Notes Off
+                except Exception as e:
+                    self._midi_ok = False
+                    self._log_ring.append(f"⚠️ MIDI output disabled after failure: {e}")
+        else:
+            # Direct note-offs - no per-note re-hash/pop through stop_note
+            if self._fs_ok:
+                try:
+                    fs_noteoff = self._fs_noteoff
+                    for midi_note in notes:
+                        fs_noteoff(0, midi_note)
+                except Exception as e:
+                    self._fs_ok = False
+                    self._log_ring.append(f"⚠️ FluidSynth disabled after failure: {e}")
+            if self._midi_ok:
+                try:
+                    write_short = self._midi_write_short
+                    status_noteoff = self._status_noteoff
+                    for midi_note in notes:
+                        write_short(status_noteoff, midi_note, 0)
+                except Exception as e:
+                    self._midi_ok = False
+                    self._log_ring.append(f"⚠️ MIDI output disabled after failure: {e}")
     
     def set_instrument(self, instrument_name: str) -> bool:
         """Change the current instrument sound
@@ -194,43 +559,82 @@ class MidiController:
         Returns:
             bool: True if instrument was successfully changed
         """
-        if instrument_name not in self.instruments:
+        self._ensure_instruments()
+        idx = self._table.name_to_idx.get(instrument_name)
+        if idx is None:
             return False
-        
-        self.current_instrument = instrument_name
-        program_number: int = self.instruments[instrument_name]
-        
+        return self.set_instrument_by_index(idx)
+
+    def set_instrument_by_index(self, idx: int) -> bool:
+        """Change the current instrument by its index in the instrument list
+
+        Skips name resolution entirely - UI cycle buttons can step the
+        index directly.
+
+        Args:
+            idx (int): Index into get_available_instruments()
+
+        Returns:
+            bool: True if instrument was successfully changed
+        """
+        self._ensure_instruments()
+        table = self._table
+        if not 0 <= idx < len(table.names):
+            return False
+
+        # Re-selecting the active instrument is a no-op - program_select
+        # re-loads preset data and can drop sounding voices
+        if idx == self._current_idx:
+            return True
+
+        self._current_idx = idx
+        self._log_ring.append(f"🎸 Switched to: {table.names[idx]}")
+
+        # Two names can alias the same program number; nothing to re-send
+        program_number: int = table.programs[idx]
+        if program_number == self._last_program:
+            return True
+        self._last_program = program_number
+
         # Change FluidSynth instrument (bank 0, program number)
         if self.fs and self.soundfont_id is not None:
             self.fs.program_select(0, self.soundfont_id, 0, program_number)
-        
-        # Change external MIDI device instrument
+
+        # Change external MIDI device instrument - a raw Program Change
+        # instead of the set_instrument wrapper and its bookkeeping
         if self.midi_out:
-            self.midi_out.set_instrument(program_number, 0)
-        
-        print(f"🎸 Switched to: {instrument_name}")
+            self._midi_write_short(self._status_program, program_number, 0)
+
         return True
-    
-    def get_available_instruments(self) -> List[str]:
-        """Get list of available instrument names
-        
+
+    def get_available_instruments(self) -> Tuple[str, ...]:
+        """Get the available instrument names
+
         Returns:
-            List[str]: List of instrument names that can be selected
+            Tuple[str, ...]: Instrument names that can be selected,
+                immutable by construction
         """
-        return list(self.instruments.keys())
-    
+        self._ensure_instruments()
+        return self._table.names
+
     def get_current_instrument(self) -> str:
         """Get the currently selected instrument name
-        
+
         Returns:
-            str: Name of current instrument
+            str: Name of current instrument, or "" if none is selected
         """
-        return self.current_instrument
+        return self._table.names[self._current_idx] if self._current_idx >= 0 else ""
     
     def cleanup(self) -> None:
         """Clean up MIDI and FluidSynth resources"""
+        # Don't tear down underneath an in-flight SoundFont load
+        self._ready.wait(timeout=2.0)
         self.stop_all_notes()
-        
+
+        # Let the worker drain any queued note events before the devices close
+        self._event_q.put(None)
+        self._note_worker.join(timeout=1.0)
+
         if self.midi_out:
             self.midi_out.close()
             